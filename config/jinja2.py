@@ -1,3 +1,4 @@
+import functools
 from datetime import date
 from zoneinfo import ZoneInfo
 
@@ -52,6 +53,13 @@ def datum_nl(datum, fmt="N Y"):
             datum = date.fromisoformat(datum)
         except ValueError:
             return datum
+    return _format_date(datum, fmt)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_date(datum, fmt):
+    # List rows repeat the same few dates; the site only speaks Dutch
+    # (settings.LANGUAGES), so the active locale can't change the result.
     return date_format(datum, fmt)
 
 
@@ -0,0 +1,12 @@
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Start every test with an empty cache.
+
+    Test transactions are rolled back without firing post_delete signals, so
+    cached reference data (e.g. filter options) would otherwise leak between tests.
+    """
+    cache.clear()
@@ -4,8 +4,9 @@ import urllib.parse
 
 from django.utils import timezone
 
-from wies.core.models import LabelCategory, Placement
+from wies.core.models import Placement
 from wies.core.querysets import annotate_placement_dates
+from wies.core.services.filter_options import get_label_category_options
 
 
 def _onboarding_owner_mailto(assignment) -> str:
@@ -59,7 +60,7 @@ def onboarding(request):
     colleague = getattr(user, "colleague", None)
     return {
         "show_onboarding": True,
-        "onboarding_label_categories": list(LabelCategory.objects.all()),
+        "onboarding_label_categories": get_label_category_options(),
         "onboarding_colleague": colleague,
         "onboarding_assignments": _onboarding_assignments(colleague),
     }
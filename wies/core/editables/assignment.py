@@ -4,6 +4,7 @@ Permissions live in ``wies/core/permission_rules.py``.
 """
 
 import urllib.parse
+from operator import itemgetter
 
 from django import forms
 from django.db import transaction
@@ -13,9 +14,13 @@ from django.utils import timezone
 
 from wies.core.fields import OrganizationsField
 from wies.core.inline_edit import Editable, EditableCollection, EditableGroup, EditableSet
-from wies.core.models import Assignment, AssignmentOrganizationUnit, Colleague, Skill
+from wies.core.models import Assignment, AssignmentOrganizationUnit, Colleague
 from wies.core.placement_visibility import LABELS, evaluate
-from wies.core.services.assignments import apply_services_to_assignment, extract_services_data
+from wies.core.services.assignments import (
+    apply_services_to_assignment,
+    extract_services_data,
+    get_service_skill_choices,
+)
 from wies.core.services.urls import current_page_path
 
 
@@ -93,13 +98,6 @@ def _organizations_render_change(state) -> str:
     return ", ".join(parts)
 
 
-def _skill_choices():
-    # Matches the shape used by assignment-create so service_row.html renders identically.
-    choices = [("", " "), ("__new__", "+ Nieuwe rol aanmaken")]
-    choices.extend((str(s.id), s.name) for s in Skill.objects.order_by("name"))
-    return choices
-
-
 def _services_initial(assignment):
     """One row per service, vacancies first."""
     from wies.core.models import Placement  # noqa: PLC0415 — avoids circular import
@@ -145,7 +143,7 @@ def _services_initial(assignment):
                 "service": service,
             }
         )
-    rows.sort(key=lambda r: r["is_filled"])
+    rows.sort(key=itemgetter("is_filled"))
     return rows
 
 
@@ -154,7 +152,20 @@ def visible_service_rows(assignment, request) -> list[dict]:
     formset and audit state) returns every placement; here a placement that is
     not currently active (ended or not yet started) is hidden from unrelated
     viewers — only the placed colleague and the BM-owner see it, flagged
-    ``historical`` with a chip label and a privacy note."""
+    ``historical`` with a chip label and a privacy note.
+
+    Cached on the request, keyed by opdracht: the side panel counts these rows
+    for its header and then renders them in the team list. Only display code
+    calls this, after any save in the request has happened."""
+    if not hasattr(request, "wies_visible_service_rows"):
+        request.wies_visible_service_rows = {}
+    cache = request.wies_visible_service_rows
+    if assignment.id not in cache:
+        cache[assignment.id] = _visible_service_rows(assignment, request)
+    return cache[assignment.id]
+
+
+def _visible_service_rows(assignment, request) -> list[dict]:
     today = timezone.now().date()
     viewer = getattr(getattr(request, "user", None), "colleague", None)
     viewer_is_bm = viewer is not None and assignment.owner_id == viewer.id
@@ -193,7 +204,7 @@ def _services_formset_factory(data=None, initial=None):
     # so the same row partial renders identically on create and inline-edit.
     from wies.core.forms import ServiceFormSet  # noqa: PLC0415 — avoids circular import
 
-    kwargs = {"prefix": "service", "form_kwargs": {"skill_choices": _skill_choices()}}
+    kwargs = {"prefix": "service", "form_kwargs": {"skill_choices": get_service_skill_choices()}}
     if data is not None:
         return ServiceFormSet(data, **kwargs)
     return ServiceFormSet(initial=initial or [], **kwargs)
@@ -282,22 +293,13 @@ def _change_colleague_names(change: dict) -> set[str]:
 
 
 def _visible_colleague_names(assignment, request, viewer) -> set[str]:
-    """Names ``viewer`` may already see on this opdracht.
-
-    Cached on the request, keyed by opdracht: the timeline calls this once per
-    team event and ``visible_service_rows`` costs a query each time. Keyed on
-    the request rather than the assignment instance because the answer depends
-    on the viewer, and a request has exactly one.
-    """
-    if not hasattr(request, "wies_visible_colleague_names"):
-        request.wies_visible_colleague_names = {}
-    cache = request.wies_visible_colleague_names
-    if assignment.id not in cache:
-        names = {row["colleague"].name for row in visible_service_rows(assignment, request) if row["colleague"]}
-        if viewer is not None:
-            names.add(viewer.name)
-        cache[assignment.id] = names
-    return cache[assignment.id]
+    """Names ``viewer`` may already see on this opdracht. The timeline calls
+    this once per team event; the rows behind it are cached on the request by
+    ``visible_service_rows``."""
+    names = {row["colleague"].name for row in visible_service_rows(assignment, request) if row["colleague"]}
+    if viewer is not None:
+        names.add(viewer.name)
+    return names
 
 
 def _services_visible_changes(assignment, request, changes: list[dict]) -> list[dict]:
@@ -10,6 +10,7 @@ from wies.core.editables.user import UserEditables
 
 from .form_mixins import RvoErrorList, RvoFormMixin, RvoJinja2Renderer
 from .models import Colleague, Label, LabelCategory, Skill
+from .services.assignments import get_service_skill_choices
 from .services.users import validate_email_domain
 from .widgets import MultiselectDropdown
 
@@ -225,8 +226,7 @@ class ServiceForm(RvoFormMixin, forms.Form):
         super().__init__(*args, **kwargs)
         # Replace ModelChoiceField with a ChoiceField so __new__ is a valid value
         if skill_choices is None:
-            skill_choices = [("", " "), ("__new__", "+ Nieuwe rol aanmaken")]
-            skill_choices.extend((str(s.id), s.name) for s in Skill.objects.order_by("name"))
+            skill_choices = get_service_skill_choices()
         self.fields["skill"] = forms.ChoiceField(
             label="Rol",
             choices=skill_choices,
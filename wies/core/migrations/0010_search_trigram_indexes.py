@@ -0,0 +1,30 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+from django.db.models.functions import Upper
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0009_errorevent"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="colleague",
+            index=GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="colleague_name_trgm"),
+        ),
+        migrations.AddIndex(
+            model_name="assignment",
+            index=GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="assignment_name_trgm"),
+        ),
+        migrations.AddIndex(
+            model_name="assignment",
+            index=GinIndex(OpClass(Upper("extra_info"), name="gin_trgm_ops"), name="assignment_extra_info_trgm"),
+        ),
+        migrations.AddIndex(
+            model_name="organizationunit",
+            index=GinIndex(OpClass(Upper("label"), name="gin_trgm_ops"), name="orgunit_label_trgm"),
+        ),
+    ]
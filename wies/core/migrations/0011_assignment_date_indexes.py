@@ -0,0 +1,20 @@
+# Generated by Django 6.0.7 on 2026-10-17 02:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0010_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="assignment",
+            index=models.Index(fields=["start_date"], name="core_assign_start_d_ad3328_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="assignment",
+            index=models.Index(fields=["end_date"], name="core_assign_end_dat_9d1b68_idx"),
+        ),
+    ]
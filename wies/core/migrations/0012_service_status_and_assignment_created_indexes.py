@@ -0,0 +1,23 @@
+# Generated by Django 6.0.7 on 2026-10-17 02:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0011_assignment_date_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="assignment",
+            index=models.Index(
+                models.OrderBy(models.F("created_at"), descending=True, nulls_last=True),
+                name="assignment_created_at_desc",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="service",
+            index=models.Index(fields=["assignment", "status"], name="core_servic_assignm_359fbe_idx"),
+        ),
+    ]
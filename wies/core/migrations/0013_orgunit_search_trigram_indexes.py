@@ -0,0 +1,36 @@
+# Generated by Django 6.0.7 on 2026-10-17 02:26
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0012_service_status_and_assignment_created_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="organizationunit",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="orgunit_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="organizationunit",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast("abbreviations", models.TextField())
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="orgunit_abbreviations_trgm",
+            ),
+        ),
+    ]
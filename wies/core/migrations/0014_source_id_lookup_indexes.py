@@ -0,0 +1,28 @@
+# Generated by Django 6.0.7 on 2026-10-17 02:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0013_orgunit_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="assignment",
+            index=models.Index(fields=["source", "source_id"], name="core_assign_source_9432d8_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="colleague",
+            index=models.Index(fields=["source", "source_id"], name="core_collea_source_5e5051_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="placement",
+            index=models.Index(fields=["source", "source_id"], name="core_placem_source_2e7fbe_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="service",
+            index=models.Index(fields=["source", "source_id"], name="core_servic_source_8a53ef_idx"),
+        ),
+    ]
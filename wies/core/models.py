@@ -1,8 +1,9 @@
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import RegexValidator
 from django.db import models
-from django.db.models.functions import Lower
+from django.db.models.functions import Cast, Lower, Upper
 from django.utils import timezone
 
 SERVICE_STATUS = {
@@ -115,6 +116,12 @@ class Colleague(models.Model):
         constraints = [
             models.UniqueConstraint(Lower("email"), "source", name="unique_colleague_email_source_ci"),
         ]
+        indexes = [
+            # Trigram index on UPPER(name) so the list views' icontains search can use an index scan
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="colleague_name_trgm"),
+            # OTYS sync matches rows on (source, source_id)
+            models.Index(fields=["source", "source_id"]),
+        ]
 
     def __str__(self):
         return self.name
@@ -140,6 +147,20 @@ class Assignment(models.Model):
     source_url = models.URLField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True, null=True)
 
+    class Meta:
+        indexes = [
+            # Trigram indexes backing the icontains search on the placement and assignment lists
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="assignment_name_trgm"),
+            GinIndex(OpClass(Upper("extra_info"), name="gin_trgm_ops"), name="assignment_extra_info_trgm"),
+            # Default placement list ordering and the 'loopt af' end date filter/sort
+            models.Index(fields=["start_date"]),
+            models.Index(fields=["end_date"]),
+            # Assignment list ordering (newest first, undated last)
+            models.Index(models.F("created_at").desc(nulls_last=True), name="assignment_created_at_desc"),
+            # OTYS sync matches rows on (source, source_id)
+            models.Index(fields=["source", "source_id"]),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -172,6 +193,12 @@ class Placement(models.Model):
     source_id = models.CharField(blank=True)
     source_url = models.URLField(blank=True)  # only for non wies
 
+    class Meta:
+        indexes = [
+            # OTYS sync matches rows on (source, source_id)
+            models.Index(fields=["source", "source_id"]),
+        ]
+
     def __str__(self):
         return f"{self.colleague.name} - {self.service.description}"
 
@@ -213,6 +240,14 @@ class Service(models.Model):
     source_id = models.CharField(blank=True)
     source_url = models.URLField(blank=True)  # only for non wies
 
+    class Meta:
+        indexes = [
+            # Open-service lookups per assignment (the assignment list's base filter)
+            models.Index(fields=["assignment", "status"]),
+            # OTYS sync matches rows on (source, source_id)
+            models.Index(fields=["source", "source_id"]),
+        ]
+
     def __str__(self):
         return f"{self.description}"
 
@@ -428,6 +463,13 @@ class OrganizationUnit(models.Model):
         indexes = [
             models.Index(fields=["parent"]),
             models.Index(fields=["end_date"]),
+            GinIndex(OpClass(Upper("label"), name="gin_trgm_ops"), name="orgunit_label_trgm"),
+            # The assignment list search also matches the client's name and abbreviations
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="orgunit_name_trgm"),
+            GinIndex(
+                OpClass(Upper(Cast("abbreviations", models.TextField())), name="gin_trgm_ops"),
+                name="orgunit_abbreviations_trgm",
+            ),
         ]
 
     def __str__(self):
@@ -0,0 +1,62 @@
+"""
+Pagination for the infinite-scroll list views.
+
+The first render of a list shows the total ("N resultaten"), so it needs a
+regular Paginator. The follow-up pages that HTMX fetches while scrolling only
+render rows plus a "load more" trigger: they need to know whether a next page
+exists, not how many rows there are in total. Counting the full filtered
+queryset on every scroll step is wasted work, so those requests fetch one row
+past the page instead.
+"""
+
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+
+
+class LookaheadPage(Page):
+    """A page that knows whether a next page exists without a total count."""
+
+    def __init__(self, object_list, number, paginator, *, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+
+class LookaheadPaginator(Paginator):
+    """Paginator that never runs ``COUNT(*)``.
+
+    Each page fetches ``per_page + 1`` rows; the extra row only tells whether a
+    next page exists. A page past the first that comes back empty raises
+    ``EmptyPage`` (a 404 from the list view), like the regular Paginator.
+    ``orphans`` is accepted but has no effect.
+    """
+
+    def validate_number(self, number):
+        try:
+            number = int(number)
+        except TypeError, ValueError:
+            msg = "That page number is not an integer"
+            raise PageNotAnInteger(msg) from None
+        if number < 1:
+            msg = "That page number is less than 1"
+            raise EmptyPage(msg)
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows and number > 1:
+            msg = "That page contains no results"
+            raise EmptyPage(msg)
+        return LookaheadPage(rows[: self.per_page], number, self, has_next=len(rows) > self.per_page)
+
+
+class InfiniteScrollPaginationMixin:
+    """ListView mixin that skips the total count on HTMX scroll requests."""
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        if "HX-Request" in self.request.headers and self.request.GET.get(self.page_kwarg):
+            return LookaheadPaginator(queryset, per_page, **kwargs)
+        return super().get_paginator(queryset, per_page, **kwargs)
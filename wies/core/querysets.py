@@ -5,10 +5,10 @@ This module provides efficient database-level annotations for start_date and end
 that cascade from Assignment -> Service -> Placement hierarchy.
 """
 
-from django.db.models import Case, Count, F, Prefetch, When
+from django.db.models import Case, Count, Exists, F, OuterRef, Prefetch, When
 from django.db.models.functions import Lower
 
-from wies.core.models import Label
+from wies.core.models import Label, Placement, Service
 
 
 def annotate_placement_dates(queryset):
@@ -63,3 +63,14 @@ def annotate_usage_counts(queryset):
     labels_with_usage = Label.objects.order_by(Lower("name")).annotate(usage_count=Count("colleagues", distinct=True))
 
     return queryset.prefetch_related(Prefetch("labels", queryset=labels_with_usage))
+
+
+def open_unfilled_services(**filters):
+    """
+    OPEN services that nobody is placed on yet, optionally narrowed by ``filters``.
+
+    "No placement" is an anti-join (NOT EXISTS) rather than ``placements__isnull``,
+    which LEFT JOINs every placement row only to throw the matches away.
+    """
+    has_placement = Exists(Placement.objects.filter(service=OuterRef("pk")))
+    return Service.objects.filter(~has_placement, status="OPEN", **filters)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.db.models import Count
+from django.db.models import Count, F
 
 from wies.core.models import Assignment, AssignmentOrganizationUnit, Placement, Service, Skill
 
@@ -14,6 +15,18 @@ if TYPE_CHECKING:
     from wies.core.models import Colleague
 
 
+def get_service_skill_choices() -> list[tuple[str, str]]:
+    """Return the role dropdown choices of the service form.
+
+    Read from the database on every call, never from the cached filter
+    options: the choices validate the submitted role, and a role just created
+    through "__new__" in another worker must already be a valid choice.
+    """
+    choices = [("", " "), ("__new__", "+ Nieuwe rol aanmaken")]
+    choices.extend((str(skill_id), name) for skill_id, name in Skill.objects.order_by("name").values_list("id", "name"))
+    return choices
+
+
 def extract_services_data(service_formset) -> list[dict]:
     """Extract services_data dicts from a validated ServiceFormSet.
 
@@ -96,8 +109,11 @@ def apply_services_to_assignment(assignment: Assignment, services_data: list[dic
     """
     services_data = services_data or []
 
-    existing_service_ids = set(assignment.services.values_list("id", flat=True))
-    existing_placement_ids = set(Placement.objects.filter(service__assignment=assignment).values_list("id", flat=True))
+    # Every row edits one of these, so load them once up front rather than
+    # fetching each service and placement again inside the loop.
+    existing_services = assignment.services.in_bulk()
+    existing_placements = Placement.objects.filter(service__assignment=assignment).in_bulk()
+    existing_service_ids = set(existing_services)
     submitted_service_ids = {int(s["id"]) for s in services_data if s.get("id")}
 
     unknown_services = submitted_service_ids - existing_service_ids
@@ -114,7 +130,7 @@ def apply_services_to_assignment(assignment: Assignment, services_data: list[dic
 
         service_id = svc.get("id")
         if service_id:
-            service = assignment.services.get(id=int(service_id))
+            service = existing_services[int(service_id)]
             service.description = svc.get("description", "")
             service.skill = skill
             service.status = svc.get("status", service.status)
@@ -148,10 +164,10 @@ def apply_services_to_assignment(assignment: Assignment, services_data: list[dic
 
         if placement_id:
             placement_id = int(placement_id)
-            if placement_id not in existing_placement_ids:
+            if placement_id not in existing_placements:
                 msg = "Een of meer plaatsingen bestaan niet meer. Herlaad de pagina en probeer opnieuw."
                 raise ValidationError(msg)
-            placement = Placement.objects.get(id=placement_id)
+            placement = existing_placements[placement_id]
             if placement.service_id != service.id:
                 # The placement exists on this assignment but belongs to a
                 # different service — only reachable via tampering.
@@ -271,26 +287,37 @@ def find_duplicate_groups():
         .order_by("name")
     )
 
-    groups = []
-    for dupe in qs:
-        assignments = (
-            Assignment.objects.filter(
-                name=dupe["name"],
-                owner=dupe["owner"],
-                organization_relations__role="PRIMARY",
-                organization_relations__organization=dupe["organization_relations__organization"],
-            )
-            .select_related("owner")
-            .prefetch_related(
-                "services__placements__colleague",
-                "services__skill",
-                "organization_relations__organization",
-            )
-            .order_by("id")
+    duplicate_keys = [(d["name"], d["owner"], d["organization_relations__organization"]) for d in qs]
+    if not duplicate_keys:
+        return []
+
+    # Fetch every candidate assignment (and what the preview renders of it) in
+    # one go, then split them per key, instead of one query set per group.
+    candidates = (
+        Assignment.objects.filter(
+            name__in={name for name, _owner, _org in duplicate_keys},
+            organization_relations__role="PRIMARY",
+        )
+        .annotate(primary_org_id=F("organization_relations__organization"))
+        .select_related("owner")
+        .prefetch_related(
+            "services__placements__colleague",
+            "services__skill",
+            "organization_relations__organization",
         )
-        group = list(assignments)
+        .order_by("id")
+    )
+    by_key = defaultdict(list)
+    for assignment in candidates:
+        by_key[(assignment.name, assignment.owner_id, assignment.primary_org_id)].append(assignment)
+
+    groups = []
+    seen_first_ids = set()
+    for key in duplicate_keys:
+        group = by_key[key]
         # Avoid adding the same group twice (can happen with multiple orgs).
-        if group and not any(g[0].id == group[0].id for g in groups):
+        if group and group[0].id not in seen_first_ids:
+            seen_first_ids.add(group[0].id)
             groups.append(group)
     return groups
 
@@ -0,0 +1,81 @@
+"""Cached option lists for the list view filters.
+
+The filter panels on the list views need the full list of skills, label
+categories, labels and user groups on every render, while that data changes
+rarely. The lists are cached as plain dicts and may be briefly stale (see
+``FILTER_OPTIONS_TTL``), so they are for display only: form choices that
+validate input must query the database.
+"""
+
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+
+from wies.core.models import Label, LabelCategory, Skill
+
+# Shared by the short-lived caches of wies.core.services. The default cache is a
+# LocMemCache per gunicorn worker: the signal handlers in ``wies.core.signals``
+# only clear the worker that saved the change, and the other workers (and
+# changes made by the db_worker sync) catch up once this TTL expires.
+FILTER_OPTIONS_TTL = 60  # seconds
+
+SKILL_OPTIONS_KEY = "filter_options:skills"
+LABEL_OPTIONS_KEY = "filter_options:labels"
+LABEL_CATEGORY_OPTIONS_KEY = "filter_options:label_categories"
+GROUP_OPTIONS_KEY = "filter_options:groups"
+
+
+def get_skill_options() -> list[dict]:
+    """Return all skills as ``{"id", "name"}`` dicts, ordered by name."""
+    return cache.get_or_set(
+        SKILL_OPTIONS_KEY,
+        lambda: list(Skill.objects.order_by("name").values("id", "name")),
+        FILTER_OPTIONS_TTL,
+    )
+
+
+def invalidate_skill_options() -> None:
+    """Drop the cached skill list so the next request rebuilds it."""
+    cache.delete(SKILL_OPTIONS_KEY)
+
+
+def get_label_options() -> dict[int, list[dict]]:
+    """Return all labels as ``{"id", "name"}`` dicts, grouped by category id.
+
+    Within a category the labels keep the model's case-insensitive name order.
+    """
+    return cache.get_or_set(LABEL_OPTIONS_KEY, _load_label_options, FILTER_OPTIONS_TTL)
+
+
+def _load_label_options() -> dict[int, list[dict]]:
+    options: dict[int, list[dict]] = {}
+    for category_id, label_id, name in Label.objects.values_list("category_id", "id", "name"):
+        options.setdefault(category_id, []).append({"id": label_id, "name": name})
+    return options
+
+
+def get_label_category_options() -> list[dict]:
+    """Return all label categories as ``{"id", "name", "color"}`` dicts, ordered by name."""
+    return cache.get_or_set(
+        LABEL_CATEGORY_OPTIONS_KEY,
+        lambda: list(LabelCategory.objects.values("id", "name", "color")),
+        FILTER_OPTIONS_TTL,
+    )
+
+
+def invalidate_label_options() -> None:
+    """Drop the cached label categories and label lists so the next request rebuilds them."""
+    cache.delete_many([LABEL_CATEGORY_OPTIONS_KEY, LABEL_OPTIONS_KEY])
+
+
+def get_group_options() -> list[dict]:
+    """Return all user groups (roles) as ``{"id", "name"}`` dicts, ordered by name."""
+    return cache.get_or_set(
+        GROUP_OPTIONS_KEY,
+        lambda: list(Group.objects.order_by("name").values("id", "name")),
+        FILTER_OPTIONS_TTL,
+    )
+
+
+def invalidate_group_options() -> None:
+    """Drop the cached group list so the next request rebuilds it."""
+    cache.delete(GROUP_OPTIONS_KEY)
@@ -16,11 +16,13 @@ import requests
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
+from django.core.cache import cache
 from django.db.models import Q
 from django.utils import timezone
 
 from wies.core.models import OrganizationType, OrganizationUnit
 from wies.core.services.events import create_event
+from wies.core.services.filter_options import FILTER_OPTIONS_TTL
 
 logger = logging.getLogger(__name__)
 
@@ -510,9 +512,10 @@ def get_org_descendant_ids(root_ids: list[int]) -> set[int]:
     """Return the set of IDs for the given roots and all their descendants.
 
     Loads all OrganizationUnits once and traverses the tree in Python to avoid
-    recursive SQL — fast for typical government org trees.
+    recursive SQL — fast for typical government org trees. The (id, parent_id)
+    rows are streamed into the child map rather than first cached as a list.
     """
-    all_orgs = OrganizationUnit.objects.values_list("id", "parent_id")
+    all_orgs = OrganizationUnit.objects.values_list("id", "parent_id").iterator(chunk_size=2000)
     children_map: dict[int, list[int]] = {}
     for org_id, parent_id in all_orgs:
         if parent_id is not None:
@@ -527,12 +530,27 @@ def get_org_descendant_ids(root_ids: list[int]) -> set[int]:
     return result
 
 
+_EXCLUDED_ORG_IDS_KEY = "organizations:excluded_ids"
+_EXCLUDED_ORG_IDS_TTL = FILTER_OPTIONS_TTL
+
+
 def get_excluded_org_ids() -> set[int]:
     """Return IDs of organizations that should be hidden from display (e.g. intelligence services).
 
     Matches organizations by name or abbreviation against the exclusion lists,
-    then includes all their descendants.
+    then includes all their descendants. Every list view needs this set and
+    computing it walks the whole org tree, so it is cached; saving or deleting
+    an OrganizationUnit drops the cached set (see ``FILTER_OPTIONS_TTL``).
     """
+    return cache.get_or_set(_EXCLUDED_ORG_IDS_KEY, _compute_excluded_org_ids, _EXCLUDED_ORG_IDS_TTL)
+
+
+def invalidate_excluded_org_ids() -> None:
+    """Drop the cached excluded-org set so the next caller recomputes it."""
+    cache.delete(_EXCLUDED_ORG_IDS_KEY)
+
+
+def _compute_excluded_org_ids() -> set[int]:
     name_q = Q()
     for name in EXCLUDED_ORG_NAMES:
         name_q |= Q(name__icontains=name)
@@ -546,6 +564,43 @@ def get_excluded_org_ids() -> set[int]:
     return get_org_descendant_ids(excluded_root_ids)
 
 
+_ORG_TREE_KEY = "organizations:tree"
+_ORG_TREE_TTL = FILTER_OPTIONS_TTL
+
+
+def get_org_tree_units() -> tuple[list[dict], dict[int, list[str]]]:
+    """Return the visible organizations and the type labels of the root ones.
+
+    The client modal rebuilds the org tree every time it opens, from a table of
+    thousands of units that only the sync changes, so the rows are cached
+    like the excluded set. Callers get their own copy from the cache and may
+    annotate the dicts.
+    """
+    return cache.get_or_set(_ORG_TREE_KEY, _load_org_tree_units, _ORG_TREE_TTL)
+
+
+def invalidate_org_tree_units() -> None:
+    """Drop the cached org tree so the next caller reloads it."""
+    cache.delete(_ORG_TREE_KEY)
+
+
+def _load_org_tree_units() -> tuple[list[dict], dict[int, list[str]]]:
+    units = list(
+        OrganizationUnit.objects.exclude(id__in=get_excluded_org_ids()).values(
+            "id", "parent_id", "name", "label", "abbreviations"
+        )
+    )
+    unit_ids = {unit["id"] for unit in units}
+    root_ids = [unit["id"] for unit in units if unit["parent_id"] not in unit_ids]
+    type_links = OrganizationUnit.organization_types.through.objects.filter(
+        organizationunit_id__in=root_ids
+    ).values_list("organizationunit_id", "organizationtype__label")
+    root_types: dict[int, list[str]] = {}
+    for unit_id, type_label in type_links:
+        root_types.setdefault(unit_id, []).append(type_label)
+    return units, root_types
+
+
 _MIN_ABBREVIATION_SEARCH_LENGTH = 2
 _MAX_ABBREVIATION_RESULTS = 5
 
@@ -1,9 +1,17 @@
 import logging
 
+from django.contrib.auth.models import Group
 from django.contrib.auth.signals import user_logged_in
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from wies.core.models import Colleague
+from wies.core.models import Colleague, Label, LabelCategory, OrganizationUnit, Skill
+from wies.core.services.filter_options import (
+    invalidate_group_options,
+    invalidate_label_options,
+    invalidate_skill_options,
+)
+from wies.core.services.organizations import invalidate_excluded_org_ids, invalidate_org_tree_units
 
 logger = logging.getLogger(__name__)
 
@@ -27,3 +35,34 @@ def link_colleague_on_login(sender, request, user, **kwargs):
             email=user.email,
             source="wies",
         )
+
+
+@receiver([post_save, post_delete], sender=Skill)
+def invalidate_cached_skill_options(sender, **kwargs):
+    """Keep the cached skill filter options in sync with the Skill table."""
+    invalidate_skill_options()
+
+
+@receiver([post_save, post_delete], sender=LabelCategory)
+@receiver([post_save, post_delete], sender=Label)
+def invalidate_cached_label_options(sender, **kwargs):
+    """Keep the cached label categories and labels in sync with their tables."""
+    invalidate_label_options()
+
+
+@receiver([post_save, post_delete], sender=Group)
+def invalidate_cached_group_options(sender, **kwargs):
+    """Keep the cached role filter options in sync with the Group table."""
+    invalidate_group_options()
+
+
+@receiver([post_save, post_delete], sender=OrganizationUnit)
+def invalidate_cached_excluded_org_ids(sender, **kwargs):
+    """A renamed, re-parented or removed org can change which orgs are hidden."""
+    invalidate_excluded_org_ids()
+
+
+@receiver([post_save, post_delete], sender=OrganizationUnit)
+def invalidate_cached_org_tree(sender, **kwargs):
+    """Keep the client modal's cached org tree in sync with the table."""
+    invalidate_org_tree_units()
@@ -12,6 +12,7 @@ from wies.core.models import (
     Skill,
 )
 from wies.core.roles import setup_roles
+from wies.core.services.filter_options import get_skill_options
 
 User = get_user_model()
 
@@ -127,6 +128,29 @@ class AssignmentCreateTest(TestCase):
         assert service.status == "OPEN"
         assert service.placements.count() == 0
 
+    def test_post_accepts_skill_missing_from_cached_filter_options(self):
+        """A role created in another worker is a valid choice before the cached filter list catches up"""
+        get_skill_options()
+        # bulk_create skips the post_save signal, like a save in another process
+        (skill,) = Skill.objects.bulk_create([Skill(name="Net aangemaakt")])
+        assert skill.id not in {s["id"] for s in get_skill_options()}
+
+        self.client.force_login(self.bdm_user)
+        response = self.client.post(
+            reverse("assignment-create"),
+            {
+                "name": "Test Opdracht",
+                "owner": self.bdm_colleague.id,
+                **org_formset_data([(self.org, "PRIMARY")]),
+                **FORMSET_MGMT_1,
+                "service-0-skill": skill.id,
+                "service-0-has_custom_period": "on",
+            },
+        )
+
+        assert response.status_code == 302
+        assert Assignment.objects.get(name="Test Opdracht").services.get().skill == skill
+
     def test_post_creates_assignment_with_placement(self):
         self.client.force_login(self.bdm_user)
         response = self.client.post(
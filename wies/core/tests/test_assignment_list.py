@@ -1,7 +1,9 @@
 from datetime import date
 
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from wies.core.models import (
@@ -122,6 +124,12 @@ class AssignmentListViewTest(TestCase):
         response = self.client.get(self.list_url, {"pagina": "1"}, headers={"hx-request": "true"})
         assert response.status_code == 200
 
+    def test_htmx_pagina_skips_filter_panel(self):
+        self.client.force_login(self.auth_user)
+        response = self.client.get(self.list_url, {"pagina": "1"}, headers={"hx-request": "true"})
+        assert "filter_groups" not in response.context_data
+        assert "Open Aanvraag" in response.content.decode()
+
     def test_side_panel_with_opdracht_param(self):
         self.client.force_login(self.auth_user)
         response = self.client.get(self.list_url, {"opdracht": str(self.vacancy.id)})
@@ -197,3 +205,39 @@ class AssignmentListViewTest(TestCase):
         response = self.client.get(self.list_url, {"rol": str(self.skill.id)})
         content = response.content.decode()
         assert "Mix Opdracht" not in content
+
+    def test_filters_list_each_assignment_once(self):
+        """Matching several services and clients must not repeat the card."""
+        Service.objects.create(
+            assignment=self.vacancy, description="Service 2", skill=self.skill, status="OPEN", source="wies"
+        )
+        AssignmentOrganizationUnit.objects.create(assignment=self.vacancy, organization=self.org2, role="INVOLVED")
+
+        self.client.force_login(self.auth_user)
+        response = self.client.get(
+            self.list_url, {"rol": str(self.skill.id), "org_self": [str(self.org.id), str(self.org2.id)]}
+        )
+        assert [a.id for a in response.context_data["object_list"]] == [self.vacancy.id]
+
+    def test_card_org_label_queries_do_not_grow_with_cards(self):
+        """The client shown on each card is prefetched for the whole page."""
+        self.client.force_login(self.auth_user)
+        params = {"pagina": "1"}
+        headers = {"HX-Request": "true"}
+        with CaptureQueriesContext(connection) as one_card:
+            self.client.get(self.list_url, params, headers=headers)
+
+        for i in range(3):
+            assignment = Assignment.objects.create(name=f"Extra Aanvraag {i}", source="wies")
+            AssignmentOrganizationUnit.objects.create(assignment=assignment, organization=self.org)
+            AssignmentOrganizationUnit.objects.create(assignment=assignment, organization=self.org2, role="INVOLVED")
+            Service.objects.create(
+                assignment=assignment, description="Service", skill=self.skill, status="OPEN", source="wies"
+            )
+        with CaptureQueriesContext(connection) as four_cards:
+            response = self.client.get(self.list_url, params, headers=headers)
+
+        assert len(four_cards) == len(one_card)
+        extra = [a for a in response.context_data["object_list"] if a.name.startswith("Extra")]
+        # Same order as the organizations relation: by name
+        assert {a.org_label for a in extra} == {"Other Org"}
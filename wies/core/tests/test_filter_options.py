@@ -0,0 +1,83 @@
+from django.contrib.auth.models import Group
+from django.test import TestCase
+
+from wies.core.models import Label, LabelCategory, Skill
+from wies.core.services.filter_options import (
+    get_group_options,
+    get_label_category_options,
+    get_label_options,
+    get_skill_options,
+)
+
+
+class SkillOptionsTest(TestCase):
+    def test_returns_skills_ordered_by_name(self):
+        Skill.objects.create(name="Tester")
+        Skill.objects.create(name="Architect")
+        assert [s["name"] for s in get_skill_options()] == ["Architect", "Tester"]
+
+    def test_cached_between_calls(self):
+        Skill.objects.create(name="Architect")
+        get_skill_options()
+        with self.assertNumQueries(0):
+            get_skill_options()
+
+    def test_save_invalidates_cache(self):
+        skill = Skill.objects.create(name="Architect")
+        get_skill_options()
+        skill.name = "Ontwerper"
+        skill.save()
+        assert [s["name"] for s in get_skill_options()] == ["Ontwerper"]
+
+    def test_delete_invalidates_cache(self):
+        skill = Skill.objects.create(name="Architect")
+        get_skill_options()
+        skill.delete()
+        assert get_skill_options() == []
+
+
+class LabelOptionsTest(TestCase):
+    def test_grouped_by_category_in_name_order(self):
+        merk = LabelCategory.objects.create(name="Merk-test", color="#DCE3EA")
+        thema = LabelCategory.objects.create(name="Thema-test", color="#B3D7EE")
+        Label.objects.create(name="zeta", category=merk)
+        Label.objects.create(name="Alpha", category=merk)
+        Label.objects.create(name="Data", category=thema)
+
+        options = get_label_options()
+
+        assert [label["name"] for label in options[merk.id]] == ["Alpha", "zeta"]
+        assert [label["name"] for label in options[thema.id]] == ["Data"]
+
+    def test_label_changes_invalidate_cache(self):
+        category = LabelCategory.objects.create(name="Merk-test", color="#DCE3EA")
+        label = Label.objects.create(name="Alpha", category=category)
+        get_label_options()
+        with self.assertNumQueries(0):
+            get_label_options()
+
+        Label.objects.create(name="Beta", category=category)
+        assert [option["name"] for option in get_label_options()[category.id]] == ["Alpha", "Beta"]
+
+        label.delete()
+        assert [option["name"] for option in get_label_options()[category.id]] == ["Beta"]
+
+    def test_category_changes_invalidate_cache(self):
+        category = LabelCategory.objects.create(name="Merk-test", color="#DCE3EA")
+        assert {"id": category.id, "name": "Merk-test", "color": "#DCE3EA"} in get_label_category_options()
+        with self.assertNumQueries(0):
+            get_label_category_options()
+
+        category.color = "#B3D7EE"
+        category.save()
+        assert {"id": category.id, "name": "Merk-test", "color": "#B3D7EE"} in get_label_category_options()
+
+
+class GroupOptionsTest(TestCase):
+    def test_cached_and_invalidated_on_save(self):
+        before = get_group_options()
+        with self.assertNumQueries(0):
+            get_group_options()
+
+        group = Group.objects.create(name="Zz test rol")
+        assert get_group_options() == [*before, {"id": group.id, "name": "Zz test rol"}]
@@ -11,7 +11,9 @@ import re
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group, Permission
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from wies.core.editables import REGISTRY
@@ -1623,6 +1625,24 @@ class ColleagueLabelsInlineEditTest(TestCase):
         self.assertContains(resp, "AI")
         self.assertNotContains(resp, "Digitale weerbaarheid")
 
+    def test_profile_lists_labels_per_category(self):
+        """Each category gets a row showing the colleague's labels in it,
+        and more labels in a category do not cost more queries"""
+        self.client.get("/profiel/")  # warm the per-process caches
+
+        with CaptureQueriesContext(connection) as two_labels:
+            resp = self.client.get("/profiel/")
+        self.assertContains(resp, "Expertise")
+        self.assertContains(resp, "Thema")
+        self.assertContains(resp, "Digitale weerbaarheid")
+        self.assertNotContains(resp, "Cloud")
+
+        self.colleague.labels.add(self.label_cloud)
+        with CaptureQueriesContext(connection) as three_labels:
+            resp = self.client.get("/profiel/")
+        self.assertContains(resp, "Cloud")
+        assert len(three_labels) == len(two_labels)
+
     def test_unknown_category_id_returns_404(self):
         url = reverse(
             "inline-edit",
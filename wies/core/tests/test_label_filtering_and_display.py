@@ -1,6 +1,8 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from wies.core.models import Assignment, Colleague, Label, LabelCategory, Placement, Service, Skill
@@ -129,6 +131,16 @@ class LabelFilteringAndDisplayTest(TestCase):
         self.assertNotContains(response, "User Two")
         self.assertNotContains(response, "User Three")
 
+    def test_filter_users_matching_several_labels_listed_once(self):
+        """A user whose colleague has more than one selected label still has one row"""
+        self.client.force_login(self.auth_user)
+        self.user1_colleague.labels.add(self.rc_label)
+
+        response = self.client.get(reverse("admin-users"), {"labels": [self.rig_label.id, self.rc_label.id]})
+
+        users = list(response.context_data["object_list"])
+        assert sorted(u.id for u in users) == sorted([self.user1.id, self.user2.id, self.user3.id])
+
     def test_filter_placements_by_colleague_label(self):
         """Test: Filtering placements by colleague label works correctly"""
         self.client.force_login(self.auth_user)
@@ -168,6 +180,17 @@ class LabelFilteringAndDisplayTest(TestCase):
         self.assertContains(response, "Colleague Three")
         self.assertNotContains(response, "Colleague Two")
 
+    def test_filter_placements_matching_several_labels_listed_once(self):
+        """A colleague with more than one selected label still has one row per placement"""
+        self.client.force_login(self.auth_user)
+        self.colleague1.labels.add(self.rc_label)
+
+        response = self.client.get(reverse("home"), {"labels": [self.rig_label.id, self.rc_label.id]})
+
+        placements = list(response.context_data["object_list"])
+        assert [p.id for p in placements].count(self.placement1.id) == 1
+        assert len(placements) == len({p.id for p in placements})
+
     def test_empty_filter_state_handling(self):
         """Test: Empty filter states handled gracefully"""
         self.client.force_login(self.auth_user)
@@ -242,3 +265,20 @@ class LabelFilteringAndDisplayTest(TestCase):
         # Both placements should be visible
         assert "Colleague One" in content
         assert "Colleague Three" in content
+
+    def test_placement_panel_label_queries_do_not_grow_with_labels(self):
+        """The panel shows each label in its category colour without a query per label"""
+        self.client.force_login(self.auth_user)
+        url = reverse("home")
+        params = {"plaatsing": self.placement1.id}
+        headers = {"HX-Request": "true", "HX-Target": "side_panel-content"}
+        self.client.get(url, params, headers=headers)  # warm the per-process caches
+
+        with CaptureQueriesContext(connection) as one_label:
+            self.client.get(url, params, headers=headers)
+        self.colleague1.labels.add(self.python_label, self.django_label)
+        with CaptureQueriesContext(connection) as three_labels:
+            response = self.client.get(url, params, headers=headers)
+
+        self.assertContains(response, "#00AA00")
+        assert len(three_labels) == len(one_label)
@@ -86,6 +86,21 @@ class MergeDuplicateAssignmentsTest(TestCase):
         groups = find_duplicate_groups()
         assert len(groups) == 0
 
+    def test_find_duplicate_groups_query_count_is_constant(self):
+        """All groups come from one candidate query plus its prefetches."""
+        for name in ("CIV", "DEV", "OPS"):
+            for org in (self.org, self.org_b):
+                self._make_service(self._make_assignment(name, org), f"{name} Consultant")
+                self._make_assignment(name, org)
+
+        # duplicate keys, candidates, and one per prefetched relation (services,
+        # placements, colleagues, skills, organization relations, organizations)
+        with self.assertNumQueries(8):
+            groups = find_duplicate_groups()
+
+        assert len(groups) == 6
+        assert all(len(group) == 2 for group in groups)
+
     def test_merge_moves_services(self):
         a1 = self._make_assignment("CIV", self.org, start_date="2026-01-01", end_date="2026-06-01")
         a2 = self._make_assignment("CIV", self.org, start_date="2026-03-01", end_date="2026-09-01")
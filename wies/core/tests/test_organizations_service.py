@@ -15,7 +15,9 @@ from wies.core.models import (
     OrganizationUnit,
 )
 from wies.core.services.organizations import (
+    find_orgs_by_abbreviation,
     get_excluded_org_ids,
+    get_org_tree_units,
     iter_root_organizations,
     sync_organization_tree,
     sync_organizations,
@@ -1063,3 +1065,56 @@ class GetExcludedOrgIdsTest(TestCase):
         """Test that empty set is returned when no orgs match"""
         OrganizationUnit.objects.create(name="Ministerie van Financien")
         assert get_excluded_org_ids() == set()
+
+    def test_cached_and_invalidated_by_org_changes(self):
+        """The set is cached, but a new excluded org is picked up immediately"""
+        get_excluded_org_ids()
+        with self.assertNumQueries(0):
+            assert get_excluded_org_ids() == set()
+
+        aivd = OrganizationUnit.objects.create(name="Algemene Inlichtingen- en Veiligheidsdienst")
+        assert aivd.id in get_excluded_org_ids()
+
+
+class GetOrgTreeUnitsTest(TestCase):
+    """Tests for get_org_tree_units — the cached rows behind the client modal tree."""
+
+    def setUp(self):
+        OrganizationUnit.objects.all().delete()
+
+    def test_lists_visible_orgs_and_root_types(self):
+        ministerie = OrganizationType.objects.create(name="ministerie", label="Ministerie")
+        bzk = OrganizationUnit.objects.create(name="Ministerie van BZK")
+        bzk.organization_types.add(ministerie)
+        dgo = OrganizationUnit.objects.create(name="DG Overheid", parent=bzk)
+        OrganizationUnit.objects.create(name="Algemene Inlichtingen- en Veiligheidsdienst")
+
+        units, root_types = get_org_tree_units()
+
+        assert {unit["id"] for unit in units} == {bzk.id, dgo.id}
+        assert root_types == {bzk.id: ["Ministerie"]}
+
+    def test_cached_and_invalidated_by_org_changes(self):
+        get_org_tree_units()
+        with self.assertNumQueries(0):
+            get_org_tree_units()
+
+        org = OrganizationUnit.objects.create(name="Nieuwe Dienst")
+        assert org.id in {unit["id"] for unit in get_org_tree_units()[0]}
+
+
+class FindOrgsByAbbreviationTest(TestCase):
+    """Tests for find_orgs_by_abbreviation — the search box suggestions."""
+
+    def test_exact_abbreviation_match_case_insensitive(self):
+        bzk = OrganizationUnit.objects.create(name="Ministerie van BZK", label="BZK", abbreviations=["BZK"])
+        OrganizationUnit.objects.create(name="Ministerie van BZK en X", abbreviations=["BZKX"])
+
+        assert find_orgs_by_abbreviation(" bzk ") == [{"id": bzk.id, "label": "BZK", "name": "Ministerie van BZK"}]
+
+    def test_deleted_org_is_not_suggested(self):
+        bzk = OrganizationUnit.objects.create(name="Ministerie van BZK", abbreviations=["BZK"])
+        assert [org["id"] for org in find_orgs_by_abbreviation("BZK")] == [bzk.id]
+
+        bzk.delete()
+        assert find_orgs_by_abbreviation("BZK") == []
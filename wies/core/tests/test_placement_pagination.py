@@ -4,11 +4,15 @@ from datetime import timedelta
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.paginator import EmptyPage
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
 from wies.core.models import Assignment, Colleague, Placement, Service, Skill
+from wies.core.pagination import LookaheadPaginator
 
 User = get_user_model()
 
@@ -152,3 +156,52 @@ class TestPlacementPagination:
         # All current placements should be present
         shown_current = set(all_placement_ids) & set(current_placement_ids)
         assert len(shown_current) == 30, f"Expected all 30 current placements, only found {len(shown_current)}"
+
+    def test_scroll_page_skips_total_count(self):
+        """HTMX scroll pages only need to know whether more rows follow."""
+        skill = Skill.objects.create(name="Test Skill")
+        today = timezone.now().date()
+        for i in range(55):
+            colleague = Colleague.objects.create(name=f"Test Colleague {i}", email=f"c{i}@test.com", source="wies")
+            assignment = Assignment.objects.create(
+                name=f"Test Assignment {i}",
+                start_date=today - timedelta(days=30),
+                end_date=today + timedelta(days=30),
+                source="wies",
+            )
+            service = Service.objects.create(assignment=assignment, skill=skill, source="wies")
+            Placement.objects.create(colleague=colleague, service=service, source="wies")
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("home") + "?pagina=2", headers={"HX-Request": "true"})
+        assert response.status_code == 200
+        assert not any("COUNT(" in q["sql"] for q in ctx.captured_queries)
+
+        page_obj = response.context_data["page_obj"]
+        assert len(page_obj.object_list) == 5
+        assert not page_obj.has_next()
+        assert response.context_data["next_page_url"] is None
+
+    def test_scroll_page_past_the_end_is_not_found(self):
+        """Like a full page load, a scroll page beyond the last row is a 404."""
+        response = self.client.get(reverse("home") + "?pagina=99", headers={"HX-Request": "true"})
+        assert response.status_code == 404
+
+
+class TestLookaheadPaginator:
+    def test_has_next_from_extra_row(self):
+        paginator = LookaheadPaginator(list(range(7)), 3)
+        assert list(paginator.page(1)) == [0, 1, 2]
+        assert paginator.page(2).has_next()
+        last = paginator.page(3)
+        assert list(last) == [6]
+        assert not last.has_next()
+
+    def test_page_past_the_end_raises(self):
+        with pytest.raises(EmptyPage):
+            LookaheadPaginator(list(range(3)), 3).page(5)
+
+    def test_empty_first_page_is_allowed(self):
+        page = LookaheadPaginator([], 3).page(1)
+        assert list(page) == []
+        assert not page.has_next()
@@ -7,7 +7,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group, Permission
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db import connection
-from django.test import Client, RequestFactory, TestCase
+from django.test import Client, RequestFactory, SimpleTestCase, TestCase
 from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
@@ -26,7 +26,10 @@ from wies.core.services.organizations import get_org_descendant_ids
 from wies.core.views import (
     PlacementListView,
     _build_assignment_panel_data,
+    _build_close_url,
+    _build_panel_url,
     _get_colleague_assignments,
+    _panel_url_builder,
     _resolve_placement_panel,
 )
 
@@ -678,6 +681,17 @@ class AssignmentServicesFutureAndCountTest(TestCase):
         assert unrelated["team_count"] == 1, "hidden ended placement must not be counted"
         assert bm["team_count"] == 2, "BM sees both"
 
+    def test_panel_team_rows_are_loaded_once_per_request(self):
+        """The header count and the team list share one load of the rows"""
+        assignment = self._assignment_with_future_placement(owner=self.colleague_bob)
+        request = self._request(self.user_bob)
+
+        team_count = _build_assignment_panel_data(assignment, request)["team_count"]
+        with self.assertNumQueries(0):
+            rows = _services_display_context(assignment, request)["value"]
+
+        assert len(rows) == team_count == 1
+
 
 class PlacementPanelVisibilityTest(TestCase):
     """_resolve_placement_panel enforces the same rule as the team list for the
@@ -1620,6 +1634,24 @@ class PlacementSearchTest(TestCase):
         assert not qs.exists()
 
 
+class PlacementOrderingTest(SimpleTestCase):
+    """Tests for the 'order' parameter in PlacementListView."""
+
+    def _ordering(self, **params):
+        view = PlacementListView()
+        view.request = RequestFactory().get("/", params)
+        return view.get_ordering()
+
+    def test_known_column(self):
+        assert self._ordering(order="name") == "colleague__name"
+        assert self._ordering(order="-end_date") == "-service__assignment__end_date"
+
+    def test_missing_or_unknown_falls_back_to_default(self):
+        assert self._ordering() == "-service__assignment__start_date"
+        assert self._ordering(order="colleague__email") == "-service__assignment__start_date"
+        assert self._ordering(order="--name") == "-service__assignment__start_date"
+
+
 class PlacementLooptAfFilterTest(TestCase):
     """Tests for the 'loopt af' end-date filter in PlacementListView."""
 
@@ -1853,3 +1885,19 @@ class ClientModalPlacementCountVisibilityTest(TestCase):
         self._place(start_offset_days=-10, end_offset_days=10)
 
         assert self._modal_count_for(self.unrelated_user) == 1
+
+
+class PanelUrlBuilderTest(SimpleTestCase):
+    """The per-row builder must produce the same URL as _build_panel_url."""
+
+    def test_matches_build_panel_url(self):
+        factory = RequestFactory()
+        for query in ("", "?zoek=a b&rol=1&rol=2", "?opdracht=3&pagina=2", "?plaatsing=7"):
+            request = factory.get(f"/{query}")
+            build = _panel_url_builder(request, "plaatsing")
+            assert build(42) == _build_panel_url(request, plaatsing=42)
+
+    def test_close_url_without_query_is_bare_path(self):
+        request = RequestFactory().get("/opdrachten/")
+        assert _build_close_url(request) == "/opdrachten/"
+        assert _build_panel_url(request, opdracht=3) == "/opdrachten/?opdracht=3"
@@ -2,7 +2,17 @@ from django.contrib.auth import get_user_model
 from django.test import Client, TestCase, override_settings
 from django.utils import timezone
 
-from wies.core.models import Assignment
+from wies.core.models import (
+    Assignment,
+    AssignmentOrganizationUnit,
+    Colleague,
+    Label,
+    LabelCategory,
+    OrganizationUnit,
+    Placement,
+    Service,
+    Skill,
+)
 
 User = get_user_model()
 
@@ -61,6 +71,36 @@ class StaffDestructiveActionsGuardTest(TestCase):
         assert response.status_code != 405
 
 
+@override_settings(STAFF_EMAILS=[STAFF_EMAIL], ENABLE_DESTRUCTIVE_STAFF_ACTIONS=True)
+class StaffClearDataTest(TestCase):
+    """Verify clear_data wipes the domain tables but keeps users."""
+
+    def setUp(self):
+        self.client = Client()
+        self.staff_user = User.objects.create_user(email=STAFF_EMAIL, first_name="Staff", last_name="User")
+        self.client.force_login(self.staff_user)
+
+    def test_clear_data_removes_domain_data_and_keeps_users(self):
+        category = LabelCategory.objects.create(name="Merk", color="#DCE3EA")
+        label = Label.objects.create(name="Rijks ICT Gilde", category=category)
+        colleague = Colleague.objects.create(name="Jan", email="jan@rijksoverheid.nl", source="wies")
+        colleague.labels.add(label)
+        skill = Skill.objects.create(name="Ontwikkelaar")
+        assignment = Assignment.objects.create(name="Opdracht", source="wies", owner=colleague)
+        parent = OrganizationUnit.objects.create(name="Ministerie")
+        org = OrganizationUnit.objects.create(name="Directie", parent=parent)
+        AssignmentOrganizationUnit.objects.create(assignment=assignment, organization=org)
+        service = Service.objects.create(assignment=assignment, description="Dev", skill=skill, source="wies")
+        Placement.objects.create(colleague=colleague, service=service, source="wies")
+
+        response = self.client.post("/beheer/database/", {"action": "clear_data"})
+
+        assert response.status_code == 302
+        for model in (Assignment, Colleague, Skill, Service, Placement, Label, LabelCategory, OrganizationUnit):
+            assert not model.objects.exists(), model.__name__
+        assert User.objects.filter(pk=self.staff_user.pk).exists()
+
+
 @override_settings(STAFF_EMAILS=[STAFF_EMAIL])
 class StaffResetOnboardingTest(TestCase):
     """Verify staff can reset their own onboarding flag from the database page."""
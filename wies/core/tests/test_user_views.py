@@ -3,7 +3,9 @@ from unittest.mock import patch
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group, Permission
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from wies.core.models import Colleague, Event, Label, LabelCategory
@@ -314,6 +316,28 @@ class UserViewsTest(TestCase):
         assert response.status_code == 302
         assert response.url.startswith("/inloggen/")
 
+    def test_user_rows_do_not_load_labels(self):
+        """The rows only render names and roles"""
+        self.client.force_login(self.auth_user)
+        self.colleague1.labels.add(self.label_a)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("admin-users"), {"pagina": "1"}, headers={"HX-Request": "true"})
+
+        assert response.status_code == 200
+        assert not any("core_colleague_labels" in q["sql"] for q in queries.captured_queries)
+
+    def test_selected_labels_looked_up_once(self):
+        """The page and each category's filter counts share one lookup of the selected labels"""
+        self.client.force_login(self.auth_user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("admin-users"), {"labels": [self.label_a.id]})
+
+        assert response.status_code == 200
+        lookups = [q for q in queries.captured_queries if '"core_label"."id" IN' in q["sql"]]
+        assert len(lookups) == 1
+
     def test_user_delete_success(self):
         """Test successful user deletion"""
         self.client.force_login(self.auth_user)
@@ -338,6 +362,18 @@ class UserViewsTest(TestCase):
         assert created_event.object_id == user_id
         assert created_event.context["email"] == self.user1.email
 
+    def test_user_delete_event_records_label_and_group_names(self):
+        """The audit event keeps the deleted user's labels and roles by name"""
+        self.client.force_login(self.auth_user)
+        self.colleague1.labels.set([self.label_b, self.label_a])
+        self.user1.groups.add(self.consultant_group)
+
+        self.client.post(reverse("user-delete", args=[self.user1.id]))
+
+        context = Event.objects.last().context
+        assert context["label_names"] == ["Brand A", "Brand B"]
+        assert context["group_names"] == ["Consultant"]
+
     def test_user_delete_prevents_superuser_deletion(self):
         """Test that superusers cannot be deleted via this endpoint"""
         self.client.force_login(self.auth_user)
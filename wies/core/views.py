@@ -5,18 +5,18 @@ import urllib.parse
 from collections import Counter
 from contextlib import nullcontext
 from datetime import date, timedelta
+from functools import cached_property
 
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_not_required, permission_required, user_passes_test
 from django.contrib.auth.mixins import PermissionRequiredMixin
-from django.contrib.auth.models import Group
 from django.core import management
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.core.paginator import Paginator
-from django.db import transaction
-from django.db.models import Case, Exists, F, Model, OuterRef, Prefetch, Q, Value, When
+from django.db import connection, transaction
+from django.db.models import Case, Count, Exists, F, Model, OuterRef, Prefetch, Q, Value, When
 from django.db.models.functions import Concat
 from django.forms.utils import ErrorList
 from django.http import Http404, HttpResponse, HttpResponseForbidden, QueryDict
@@ -41,7 +41,7 @@ from wies.core.inline_edit.forms import (
 )
 from wies.core.permission_engine import Verb, has_permission
 from wies.core.placement_visibility import LABELS, evaluate
-from wies.rijksauth.services.usage import get_usage_stats
+from wies.rijksauth.services.usage import get_cached_usage_stats
 
 from .forms import (
     AssignmentCreateForm,
@@ -64,15 +64,26 @@ from .models import (
     Service,
     Skill,
 )
+from .pagination import InfiniteScrollPaginationMixin
 from .permissions import is_staff_member
-from .querysets import annotate_placement_dates, annotate_usage_counts
-from .services.assignments import create_assignment_from_form, extract_services_data
+from .querysets import annotate_placement_dates, annotate_usage_counts, open_unfilled_services
+from .services.assignments import create_assignment_from_form, extract_services_data, get_service_skill_choices
 from .services.events import create_event
+from .services.filter_options import (
+    get_group_options,
+    get_label_category_options,
+    get_label_options,
+    get_skill_options,
+    invalidate_label_options,
+    invalidate_skill_options,
+)
 from .services.organizations import (
     find_orgs_by_abbreviation,
     get_excluded_org_ids,
-    get_org_breadcrumb,
     get_org_descendant_ids,
+    get_org_tree_units,
+    invalidate_excluded_org_ids,
+    invalidate_org_tree_units,
 )
 from .services.placements import (
     create_assignments_from_csv,
@@ -125,6 +136,10 @@ PANEL_PARAMS = ("pagina", "collega", "opdracht", "plaatsing")
 def _url_drop_params(path, query, names, **overrides):
     """Rebuild ``path`` from ``query`` (a QueryDict) with ``names`` dropped and
     ``overrides`` applied. Returns ``path`` alone when no params remain."""
+    if not query:
+        # Plain page load: nothing to preserve, so skip the QueryDict copy.
+        encoded = urllib.parse.urlencode(overrides)
+        return f"{path}?{encoded}" if encoded else path
     params = query.copy()
     for name in names:
         params.pop(name, None)
@@ -144,6 +159,35 @@ def _build_close_url(request):
     return _url_drop_params(request.path, request.GET, PANEL_PARAMS)
 
 
+def _next_page_url(request, page_obj):
+    """Relative URL of the next infinite-scroll page with all current filters, or None."""
+    if page_obj is None or not page_obj.has_next():
+        return None
+    return _url_drop_params("", request.GET, ("pagina",), pagina=page_obj.next_page_number())
+
+
+def _panel_url_builder(request, param):
+    """Return a function mapping an object id to its ``param`` panel URL.
+
+    Equivalent to ``_build_panel_url(request, **{param: object_id})``, but the
+    preserved filters are encoded once so list views can build a URL per row
+    without copying and re-encoding the query string each time.
+    """
+    base = _build_close_url(request)
+    prefix = f"{base}{'&' if '?' in base else '?'}{param}="
+    return lambda object_id: f"{prefix}{object_id}"
+
+
+def _count_per(queryset, field):
+    """Count the rows of ``queryset`` per non-null ``field`` value.
+
+    Grouped in the database, so only one row per distinct value comes back
+    instead of one per (row, value) pair.
+    """
+    counts = queryset.order_by().values(field).annotate(n=Count("pk", distinct=True)).values_list(field, "n")
+    return Counter({value: n for value, n in counts if value is not None})
+
+
 def _build_assignment_panel_data(assignment, request):
     """Shared helper to build assignment panel context data for both views."""
     from wies.core.editables.assignment import visible_service_rows  # noqa: PLC0415 — avoids import cycle
@@ -170,9 +214,8 @@ def _merge_date_range(existing: dict, start, end):
         existing["end_date"] = end
 
 
-def _make_assignment_entry(name, aid, request, start_date=None, end_date=None, placement_id=None, **extra):
-    """Build a standard assignment dict for panel display."""
-    url = _build_panel_url(request, plaatsing=placement_id) if placement_id else _build_panel_url(request, opdracht=aid)
+def _make_assignment_entry(name, aid, url, start_date=None, end_date=None, **extra):
+    """Build a standard assignment dict for panel display, linking to ``url``."""
     return {
         "name": name,
         "id": aid,
@@ -190,25 +233,23 @@ def _get_colleague_assignments(request, colleague, viewer):
 
     today = timezone.now().date()
     viewer_is_colleague = viewer and colleague.id == viewer.id
+    placement_panel_url = _panel_url_builder(request, "plaatsing")
+    assignment_panel_url = _panel_url_builder(request, "opdracht")
 
     active_by_id: dict[int, dict] = {}
     historical_by_id: dict[int, dict] = {}
 
     # --- Placements (both active and ended) ---
-    placement_qs = (
-        Placement.objects.filter(colleague=colleague)
-        .select_related("service__assignment", "service__skill")
-        .values(
-            "id",
-            "service__assignment__id",
-            "service__assignment__name",
-            "service__assignment__start_date",
-            "service__assignment__end_date",
-            "service__assignment__owner_id",
-            "service__skill__name",
-            "service__description",
-        )
-        .distinct()
+    # Only forward foreign keys are joined, so each placement is one row
+    placement_qs = Placement.objects.filter(colleague=colleague).values(
+        "id",
+        "service__assignment__id",
+        "service__assignment__name",
+        "service__assignment__start_date",
+        "service__assignment__end_date",
+        "service__assignment__owner_id",
+        "service__skill__name",
+        "service__description",
     )
     placement_qs = annotate_placement_dates(placement_qs)
     for placement in placement_qs:
@@ -228,13 +269,12 @@ def _get_colleague_assignments(request, colleague, viewer):
             bucket[assignment_id] = _make_assignment_entry(
                 placement["service__assignment__name"],
                 assignment_id,
-                request,
+                placement_panel_url(placement["id"]),
                 start_date=start,
                 end_date=end,
                 historical=result.timing != "active",
                 privacy_warning_text=result.privacy_note,
                 period_label=LABELS.get(result.timing),
-                placement_id=placement["id"],
             )
         else:
             _merge_date_range(bucket[assignment_id], start, end)
@@ -252,7 +292,7 @@ def _get_colleague_assignments(request, colleague, viewer):
                 active_by_id[assignment_id] = _make_assignment_entry(
                     name,
                     assignment_id,
-                    request,
+                    assignment_panel_url(assignment_id),
                     start_date=start_date,
                     end_date=end_date,
                 )
@@ -264,7 +304,7 @@ def _get_colleague_assignments(request, colleague, viewer):
                 historical_by_id[assignment_id] = _make_assignment_entry(
                     name,
                     assignment_id,
-                    request,
+                    assignment_panel_url(assignment_id),
                     start_date=start_date,
                     end_date=end_date,
                     tags={"Business Manager": None},
@@ -286,10 +326,8 @@ def _get_colleague_assignments(request, colleague, viewer):
 
     # Convert tag sets to sorted lists for deterministic template rendering
     for assignment in (*active_by_id.values(), *historical_by_id.values()):
-        assignment["tags"] = sorted(
-            [{"skill": name, "description": desc} for name, desc in assignment["tags"].items()],
-            key=lambda t: t["skill"],
-        )
+        # Skill names are unique keys, so sorting the items orders by name alone
+        assignment["tags"] = [{"skill": name, "description": desc} for name, desc in sorted(assignment["tags"].items())]
         assignment["organization"] = primary_orgs.get(assignment["id"])
 
     # Build final sorted list: active first, then historical; within each block by start_date desc
@@ -335,9 +373,10 @@ def _build_placement_panel_data(placement, request, *, visibility=None):
     # not-yet-started placements of others.
     team_members = list(
         annotate_placement_dates(Placement.objects.filter(service__assignment=assignment))
-        .filter(Q(actual_start_date__isnull=True) | Q(actual_start_date__lte=today))
-        .filter(Q(actual_end_date__isnull=True) | Q(actual_end_date__gte=today))
-        .select_related("colleague")
+        .filter(
+            Q(actual_start_date__isnull=True) | Q(actual_start_date__lte=today),
+            Q(actual_end_date__isnull=True) | Q(actual_end_date__gte=today),
+        )
         .values_list("colleague__name", flat=True)
         .distinct()
     )
@@ -374,8 +413,11 @@ def _resolve_placement_panel(request, placement_id):
     colleague and the assignment's BM-owner. Returns panel data, or None when
     the placement does not exist or the viewer may not see it."""
     try:
-        placement = Placement.objects.select_related("colleague", "service__assignment", "service__skill").get(
-            id=placement_id
+        placement = (
+            Placement.objects.select_related("colleague", "service__assignment", "service__skill")
+            # The panel renders each label with its category colour
+            .prefetch_related("colleague__labels__category")
+            .get(id=placement_id)
         )
     except Placement.DoesNotExist:
         return None
@@ -407,7 +449,7 @@ ERRORS_PER_PAGE = 10
 @staff_required
 def staff_dashboard(request):
     # The error table is loaded separately via HTMX (see the error-table endpoint).
-    return render(request, "staff_dashboard.html", {"usage": get_usage_stats()})
+    return render(request, "staff_dashboard.html", {"usage": get_cached_usage_stats()})
 
 
 def _render_error_table(request, page_number):
@@ -469,12 +511,42 @@ def debug_request_meta(request):
     )
 
 
+# Tables wiped by the staff "clear data" action; users and audit events are kept.
+CLEAR_DATA_MODELS = (
+    Assignment,
+    Colleague,
+    Skill,
+    Placement,
+    Service,
+    LabelCategory,
+    Label,
+    OrganizationUnit,
+    OrganizationType,
+)
+
+
+def _approx_row_count(model) -> int:
+    """Row count of ``model``'s table for an informational staff stat.
+
+    Reads the planner estimate from ``pg_class.reltuples`` (a catalog lookup)
+    instead of a full ``COUNT(*)`` scan. The estimate is -1 (or 0 on older
+    Postgres) until the table has been analyzed; then an exact count is cheap
+    enough anyway.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [model._meta.db_table])
+        row = cursor.fetchone()
+    if row is None or row[0] <= 0:
+        return model.objects.count()
+    return row[0]
+
+
 @staff_required
 def staff_database(request):
     context = {
-        "assignment_count": Assignment.objects.count(),
-        "colleague_count": Colleague.objects.count(),
-        "organization_count": OrganizationUnit.objects.count(),
+        "assignment_count": _approx_row_count(Assignment),
+        "colleague_count": _approx_row_count(Colleague),
+        "organization_count": _approx_row_count(OrganizationUnit),
         "latest_tasks": get_latest_tasks(limit=3),
         "destructive_actions_enabled": settings.ENABLE_DESTRUCTIVE_STAFF_ACTIONS,
     }
@@ -483,17 +555,20 @@ def staff_database(request):
         if action == "clear_data":
             if not settings.ENABLE_DESTRUCTIVE_STAFF_ACTIONS:
                 return HttpResponse(status=405)
-            # not using flush, since that would clear users
-            Assignment.objects.all().delete()
-            Colleague.objects.all().delete()
-            Skill.objects.all().delete()
-            Placement.objects.all().delete()
-            Service.objects.all().delete()
-            LabelCategory.objects.all().delete()
-            Label.objects.all().delete()
-            OrganizationUnit.objects.update(parent=None)
-            OrganizationUnit.objects.all().delete()
-            OrganizationType.objects.all().delete()
+            # not using flush, since that would clear users. One TRUNCATE lets
+            # Postgres drop all rows (and the m2m/through tables via CASCADE)
+            # instead of Django collecting and deleting them row by row. Ids are
+            # not restarted: audit events still refer to the old object ids.
+            tables = ", ".join(connection.ops.quote_name(model._meta.db_table) for model in CLEAR_DATA_MODELS)
+            with transaction.atomic(), connection.cursor() as cursor:
+                # TRUNCATE refuses to run while deferred FK checks are pending in this transaction
+                cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+                cursor.execute(f"TRUNCATE {tables} CASCADE")
+            # TRUNCATE bypasses the post_delete signals that keep these caches fresh
+            invalidate_skill_options()
+            invalidate_label_options()
+            invalidate_excluded_org_ids()
+            invalidate_org_tree_units()
         elif action == "load_base_data":
             if not settings.ENABLE_DESTRUCTIVE_STAFF_ACTIONS:
                 return HttpResponse(status=405)
@@ -581,7 +656,91 @@ def staff_database(request):
     return render(request, "staff_database.html", context)
 
 
-class PlacementListView(ListView):
+# 'Loopt af' (ends within) presets on the placement list: (value, label, days ahead).
+# "6m+" selects everything ending after the last preset.
+LOOPT_AF_PRESETS = (
+    ("3m", "Binnen 3 maanden", 91),
+    ("6m", "Binnen 6 maanden", 182),
+)
+LOOPT_AF_PRESET_DAYS = {value: days for value, _label, days in LOOPT_AF_PRESETS}
+LOOPT_AF_BEYOND_DAYS = max(LOOPT_AF_PRESET_DAYS.values())
+
+
+# Partials that only swap in list rows or the side panel; they never render
+# the filter panel, so the list views skip building its options and counts.
+TEMPLATES_WITHOUT_FILTERS = frozenset(
+    {
+        "parts/placement_table_rows.html",
+        "parts/assignment_card_rows.html",
+        "parts/user_table_rows.html",
+        "parts/side_panel.html",
+        "parts/placement_panel_content.html",
+        "parts/colleague_panel_content.html",
+        "parts/assignment_panel_content.html",
+    }
+)
+
+
+def _build_org_chip_data(org_filter, org_self_filter, org_type_filter):
+    """Chip display data for the active org, org_self and org_type filters.
+
+    The labels for both org id lists come from a single query.
+    """
+    org_ids = {int(x) for x in (*org_filter, *org_self_filter)}
+    org_labels = dict(OrganizationUnit.objects.filter(id__in=org_ids).values_list("id", "label")) if org_ids else {}
+
+    org_chip_data: list[dict] = [
+        {
+            "param_name": "org",
+            "param_value": org_id,
+            "label": org_labels.get(int(org_id), f"Organisatie {org_id}"),
+        }
+        for org_id in org_filter
+    ]
+    org_chip_data.extend(
+        {
+            "param_name": "org_self",
+            "param_value": org_id,
+            "label": f"{org_labels.get(int(org_id), f'Organisatie {org_id}')} (direct)",
+        }
+        for org_id in org_self_filter
+    )
+    org_chip_data.extend(
+        {
+            "param_name": "org_type",
+            "param_value": type_label,
+            "label": ORG_TYPE_PLURAL.get(type_label, type_label),
+        }
+        for type_label in org_type_filter
+    )
+    return org_chip_data
+
+
+def _add_panel_data(request, context):
+    """Resolve the side panel selected by the plaatsing/collega/opdracht params into context."""
+    placement_id = request.GET.get("plaatsing")
+    colleague_id = request.GET.get("collega")
+    assignment_id = request.GET.get("opdracht")
+
+    if placement_id:
+        panel_data = _resolve_placement_panel(request, placement_id)
+        if panel_data is not None:
+            context["panel_data"] = panel_data
+    elif colleague_id and not assignment_id:
+        try:
+            colleague = Colleague.objects.prefetch_related("labels__category").get(id=colleague_id)
+            context["panel_data"] = _build_colleague_panel_data(colleague, request)
+        except Colleague.DoesNotExist:
+            pass
+    elif assignment_id:
+        try:
+            assignment = Assignment.objects.select_related("owner").get(id=assignment_id)
+            context["panel_data"] = _build_assignment_panel_data(assignment, request)
+        except Assignment.DoesNotExist:
+            pass
+
+
+class PlacementListView(InfiniteScrollPaginationMixin, ListView):
     """View for placements table view with infinite scroll pagination"""
 
     model = Placement
@@ -589,63 +748,86 @@ class PlacementListView(ListView):
     paginate_by = 50
     page_kwarg = "pagina"
 
-    def _get_base_queryset(self):
-        """Base queryset with search, ordering, and date filters applied."""
-        excluded_org_ids = get_excluded_org_ids()
+    @cached_property
+    def excluded_org_ids(self):
+        """Hidden organizations, resolved once per request (it walks the whole org tree)."""
+        return get_excluded_org_ids()
+
+    # Sortable columns: ?order=<key> or ?order=-<key>. Anything else keeps the default.
+    ORDER_FIELDS = {
+        "name": "colleague__name",
+        "assignment": "service__assignment__name",
+        "skill": "service__skill__name",
+        "end_date": "service__assignment__end_date",
+    }
+    DEFAULT_ORDERING = "-service__assignment__start_date"
+
+    def get_ordering(self):
+        """Resolve the ``order`` param against ORDER_FIELDS."""
+        order_param = self.request.GET.get("order", "")
+        order_by = self.ORDER_FIELDS.get(order_param.removeprefix("-"))
+        if order_by is None:
+            return self.DEFAULT_ORDERING
+        return f"-{order_by}" if order_param.startswith("-") else order_by
+
+    @cached_property
+    def base_queryset(self):
+        """Base queryset with search, ordering, and date filters applied.
+
+        Built once per request: the page and every filter count start from it.
+        """
+        excluded_org_ids = self.excluded_org_ids
         qs = (
-            Placement.objects.select_related("colleague", "service", "service__skill")
+            Placement.objects.select_related("colleague", "service__skill", "service__assignment")
+            # Only the columns the table rows render; the wide assignment text
+            # fields (extra_info) and source metadata stay in the database.
+            .only("colleague__name", "service__skill__name", "service__assignment__name")
             .prefetch_related(
-                "colleague__labels",
                 Prefetch(
                     "service__assignment__organization_relations",
-                    queryset=AssignmentOrganizationUnit.objects.annotate(
-                        role_order=Case(
+                    # Primary client first; sort on the expression rather than
+                    # selecting it as an extra column nobody reads. Only the
+                    # client's display name is rendered, so the wide organization
+                    # row (abbreviations, identifiers) stays in the database.
+                    queryset=AssignmentOrganizationUnit.objects.order_by(
+                        Case(
                             When(role="PRIMARY", then=0),
                             default=1,
                         )
                     )
-                    .order_by("role_order")
-                    .select_related("organization"),
+                    .select_related("organization")
+                    .only("assignment_id", "organization__name", "organization__label"),
                     to_attr="sorted_clients",
                 ),
             )
-            .order_by("-service__assignment__start_date")
+            .order_by(self.get_ordering())
         )
         if excluded_org_ids:
             qs = qs.exclude(service__assignment__organizations__id__in=excluded_org_ids)
 
         search_filter = self.request.GET.get("zoek")
         if search_filter:
+            # Match clients in a semi-join so a multi-client assignment doesn't multiply rows
+            client_match = AssignmentOrganizationUnit.objects.filter(
+                assignment=OuterRef("service__assignment"),
+                organization__label__icontains=search_filter,
+            )
             qs = qs.filter(
                 Q(colleague__name__icontains=search_filter)
                 | Q(service__assignment__name__icontains=search_filter)
                 | Q(service__assignment__extra_info__icontains=search_filter)
-                | Q(service__assignment__organizations__label__icontains=search_filter)
+                | Exists(client_match)
             )
 
-        order_mapping = {
-            "name": "colleague__name",
-            "assignment": "service__assignment__name",
-            "skill": "service__skill__name",
-            "end_date": "service__assignment__end_date",
-        }
-
-        order_param = self.request.GET.get("order")
-        if order_param:
-            descending = order_param.startswith("-")
-            field_name = order_param.lstrip("-")
-            order_by = order_mapping.get(field_name)
-            if order_by:
-                qs = qs.order_by(f"-{order_by}" if descending else order_by)
-
         # Active placements are public; ended ones are hidden from everyone;
         # not-yet-started ones only for the placed colleague and the BM-owner.
         qs = annotate_placement_dates(qs)
         viewer = getattr(self.request.user, "colleague", None)
         return filter_visible_placements(qs, timezone.now().date(), viewer)
 
-    def _get_labels_by_category(self):
-        """Parse selected label IDs grouped by category."""
+    @cached_property
+    def labels_by_category(self):
+        """Selected label IDs grouped by category, looked up once per request."""
         label_ids = [int(lid) for lid in self.request.GET.getlist("labels") if lid.isdigit()]
         if not label_ids:
             return {}
@@ -657,26 +839,31 @@ class PlacementListView(ListView):
     def _get_loopt_af_options(self, base_qs):
         """Build 'loopt af' filter options with cumulative counts."""
         today = timezone.now().date()
-        filtered_qs = self._apply_filters(base_qs, exclude_filter="loopt_af").distinct()
-        presets = [
-            ("3m", "Binnen 3 maanden", 91),
-            ("6m", "Binnen 6 maanden", 182),
-        ]
+        filtered_qs = self._apply_filters(base_qs, exclude_filter="loopt_af")
+        half_year = today + timedelta(days=LOOPT_AF_BEYOND_DAYS)
+        # One round-trip for all buckets instead of a COUNT(*) per option
+        aggregates = {
+            f"within_{days}": Count("pk", filter=Q(service__assignment__end_date__lte=today + timedelta(days=days)))
+            for _value, _label, days in LOOPT_AF_PRESETS
+        }
+        aggregates["beyond"] = Count("pk", filter=Q(service__assignment__end_date__gt=half_year))
+        counts = filtered_qs.aggregate(**aggregates)
+
         options = [{"value": "", "label": ""}]
-        for value, label, days in presets:
-            end_date = today + timedelta(days=days)
-            count = filtered_qs.filter(service__assignment__end_date__lte=end_date).count()
-            options.append({"value": value, "label": label, "count": count})
+        options.extend(
+            {"value": value, "label": label, "count": counts[f"within_{days}"]}
+            for value, label, days in LOOPT_AF_PRESETS
+        )
         # "Longer than 6 months"
-        half_year = today + timedelta(days=182)
-        count_beyond = filtered_qs.filter(service__assignment__end_date__gt=half_year).count()
-        options.append({"value": "6m+", "label": "Langer dan 6 maanden", "count": count_beyond})
+        options.append({"value": "6m+", "label": "Langer dan 6 maanden", "count": counts["beyond"]})
         return options
 
     def _apply_filters(self, qs, *, exclude_filter=None):
         """Apply all selection filters, optionally excluding one filter type.
 
         exclude_filter can be: "rol", "org", "loopt_af", or a category_id (int) for labels.
+        The many-to-many filters (clients, labels) are semi-joins, so every
+        placement stays a single row and no DISTINCT is needed.
         """
         if exclude_filter != "rol":
             rol_filter = [x for x in self.request.GET.getlist("rol") if x.isdigit()]
@@ -701,31 +888,42 @@ class PlacementListView(ListView):
                     matching_ids |= get_org_descendant_ids(type_root_ids)
                 if org_self_ids:
                     matching_ids |= set(org_self_ids)
-                qs = qs.filter(service__assignment__organizations__id__in=matching_ids)
+                qs = qs.filter(
+                    Exists(
+                        AssignmentOrganizationUnit.objects.filter(
+                            assignment=OuterRef("service__assignment"), organization_id__in=matching_ids
+                        )
+                    )
+                )
 
         # Label filter: OR within category, AND between categories
-        labels_by_category = self._get_labels_by_category()
+        labels_by_category = self.labels_by_category
         for cat_id, cat_label_ids in labels_by_category.items():
             if exclude_filter != cat_id:
-                qs = qs.filter(colleague__labels__id__in=cat_label_ids)
+                qs = qs.filter(
+                    Exists(
+                        Colleague.labels.through.objects.filter(
+                            colleague_id=OuterRef("colleague_id"), label_id__in=cat_label_ids
+                        )
+                    )
+                )
 
         # Filter by assignment end date (preset period)
         if exclude_filter != "loopt_af":
             loopt_af_values = set(self.request.GET.getlist("loopt_af"))
             if loopt_af_values:
                 today = timezone.now().date()
-                preset_days = {"3m": 91, "6m": 182}
                 has_beyond = "6m+" in loopt_af_values
-                bounded = {v for v in loopt_af_values if v in preset_days}
-                half_year = today + timedelta(days=182)
+                bounded = {v for v in loopt_af_values if v in LOOPT_AF_PRESET_DAYS}
+                half_year = today + timedelta(days=LOOPT_AF_BEYOND_DAYS)
                 if bounded and has_beyond:
-                    max_days = max(preset_days[v] for v in bounded)
+                    max_days = max(LOOPT_AF_PRESET_DAYS[v] for v in bounded)
                     end_date = today + timedelta(days=max_days)
                     qs = qs.filter(
                         Q(service__assignment__end_date__lte=end_date) | Q(service__assignment__end_date__gt=half_year)
                     )
                 elif bounded:
-                    max_days = max(preset_days[v] for v in bounded)
+                    max_days = max(LOOPT_AF_PRESET_DAYS[v] for v in bounded)
                     end_date = today + timedelta(days=max_days)
                     qs = qs.filter(service__assignment__end_date__lte=end_date)
                 elif has_beyond:
@@ -735,12 +933,11 @@ class PlacementListView(ListView):
 
     def get_queryset(self):
         """Apply filters to placements queryset - only show INGEVULD assignments, not LEAD"""
-        qs = self._get_base_queryset()
+        qs = self.base_queryset
         label_ids = [int(lid) for lid in self.request.GET.getlist("labels") if lid.isdigit()]
-        if label_ids and not self._get_labels_by_category():
+        if label_ids and not self.labels_by_category:
             return Placement.objects.none()
-        qs = self._apply_filters(qs)
-        return qs.distinct()
+        return self._apply_filters(qs)
 
     def get_template_names(self):
         """Return appropriate template based on request type"""
@@ -771,8 +968,14 @@ class PlacementListView(ListView):
         context["render_filter_fields_oob"] = "HX-Request" in self.request.headers
 
         # Add panel URLs to placement objects
+        placement_panel_url = _panel_url_builder(self.request, "plaatsing")
         for placement in context["object_list"]:
-            placement.panel_url = _build_panel_url(self.request, plaatsing=placement.id)
+            placement.panel_url = placement_panel_url(placement.id)
+
+        if self.get_template_names()[0] in TEMPLATES_WITHOUT_FILTERS:
+            context["next_page_url"] = _next_page_url(self.request, context.get("page_obj"))
+            _add_panel_data(self.request, context)
+            return context
 
         context["filter_target_url"] = reverse("home")
         context["search_field"] = "zoek"
@@ -812,98 +1015,64 @@ class PlacementListView(ListView):
         if org_type_filter:
             active_filters["org_type"] = org_type_filter
 
-        # Build chip display data for org filters
-        org_chip_data: list[dict] = []
-        if org_filter:
-            org_labels = dict(
-                OrganizationUnit.objects.filter(id__in=[int(x) for x in org_filter]).values_list("id", "label")
-            )
-            org_chip_data.extend(
-                {
-                    "param_name": "org",
-                    "param_value": org_id,
-                    "label": org_labels.get(int(org_id), f"Organisatie {org_id}"),
-                }
-                for org_id in org_filter
-            )
-        if org_self_filter:
-            org_self_labels = dict(
-                OrganizationUnit.objects.filter(id__in=[int(x) for x in org_self_filter]).values_list("id", "label")
-            )
-            for org_id in org_self_filter:
-                base_label = org_self_labels.get(int(org_id), f"Organisatie {org_id}")
-                org_chip_data.append(
-                    {
-                        "param_name": "org_self",
-                        "param_value": org_id,
-                        "label": f"{base_label} (direct)",
-                    }
-                )
-        org_chip_data.extend(
-            {
-                "param_name": "org_type",
-                "param_value": type_label,
-                "label": ORG_TYPE_PLURAL.get(type_label, type_label),
-            }
-            for type_label in org_type_filter
-        )
+        org_chip_data = _build_org_chip_data(org_filter, org_self_filter, org_type_filter)
 
         # For each filter category, count on a queryset excluding that category's filter
-        base_qs = self._get_base_queryset()
+        base_qs = self.base_queryset
 
+        label_options = get_label_options()
         label_filter_groups = []
-        for category in LabelCategory.objects.all():
+        for category in get_label_category_options():
             # Count with all filters EXCEPT this label category
-            cat_filtered_qs = self._apply_filters(base_qs, exclude_filter=category.id).distinct()
+            cat_filtered_qs = self._apply_filters(base_qs, exclude_filter=category["id"])
             cat_placement_qs = Placement.objects.filter(id__in=cat_filtered_qs.values_list("id", flat=True))
-            cat_label_ids = cat_placement_qs.values_list("colleague__labels__id", flat=True)
-            cat_label_counts = Counter(lid for lid in cat_label_ids if lid is not None)
+            cat_label_counts = _count_per(cat_placement_qs, "colleague__labels__id")
 
             options = [{"value": "", "label": ""}]
             selected_values = []
-            for label in Label.objects.filter(category=category):
+            for label in label_options.get(category["id"], ()):
+                value = str(label["id"])
                 options.append(
                     {
-                        "value": str(label.id),
-                        "label": f"{label.name}",
-                        "category_color": category.color,
-                        "count": cat_label_counts.get(label.id, 0),
+                        "value": value,
+                        "label": label["name"],
+                        "category_color": category["color"],
+                        "count": cat_label_counts.get(label["id"], 0),
                     }
                 )
-                if str(label.id) in active_filters.get("labels", set()):
+                if value in label_filter:
                     options[-1]["selected"] = True
-                    selected_values.append(str(label.id))
+                    selected_values.append(value)
 
             label_filter_groups.append(
                 {
                     "type": "select-multi",
                     "name": "labels",
-                    "label": category.name,
+                    "label": category["name"],
                     "options": options,
                     "selected_values": selected_values,
                 }
             )
 
         # Skill/role counts: exclude role filter
-        skill_filtered_qs = self._apply_filters(base_qs, exclude_filter="rol").distinct()
+        skill_filtered_qs = self._apply_filters(base_qs, exclude_filter="rol")
         skill_placement_qs = Placement.objects.filter(id__in=skill_filtered_qs.values_list("id", flat=True))
-        skill_ids = skill_placement_qs.values_list("service__skill__id", flat=True)
-        skill_counts = Counter(sid for sid in skill_ids if sid is not None)
+        skill_counts = _count_per(skill_placement_qs, "service__skill__id")
 
         # Org counts: exclude the org filter (like rol/labels) so the numbers
         # reflect the other active filters instead of a global baseline.
-        org_filtered_qs = self._apply_filters(base_qs, exclude_filter="org").distinct()
+        org_filtered_qs = self._apply_filters(base_qs, exclude_filter="org")
         org_placement_qs = Placement.objects.filter(id__in=org_filtered_qs.values_list("id", flat=True))
-        org_id_values = org_placement_qs.values_list("service__assignment__organizations__id", flat=True)
-        org_counts = Counter(oid for oid in org_id_values if oid is not None)
+        org_counts = _count_per(org_placement_qs, "service__assignment__organizations__id")
 
         skill_options = [{"value": "", "label": ""}]
         skill_selected_values = []
-        for skill in Skill.objects.order_by("name"):
-            option = {"value": str(skill.id), "label": skill.name, "count": skill_counts.get(skill.id, 0)}
-            if str(skill.id) in active_filters.get("rol", set()):
+        for skill in get_skill_options():
+            value = str(skill["id"])
+            option = {"value": value, "label": skill["name"], "count": skill_counts.get(skill["id"], 0)}
+            if value in rol_filter:
                 option["selected"] = True
-                skill_selected_values.append(str(skill.id))
+                skill_selected_values.append(value)
             skill_options.append(option)
 
         context["active_filters"] = active_filters
@@ -920,7 +1089,7 @@ class PlacementListView(ListView):
                 "label": "Opdrachtgever",
                 "top_options": _get_top_org_options(
                     "placements",
-                    get_excluded_org_ids(),
+                    self.excluded_org_ids,
                     set(org_filter),
                     selected_self_ids=set(org_self_filter),
                     selected_type_labels=set(org_type_filter),
@@ -946,38 +1115,13 @@ class PlacementListView(ListView):
         _finalize_filter_groups(context["filter_groups"])
         context["filter_modal_group_id"] = self.request.GET.get("filter_modal", "")
 
-        # Build next page URL with all current filters
-        if context.get("page_obj") and context["page_obj"].has_next():
-            params = self.request.GET.copy()
-            params["pagina"] = context["page_obj"].next_page_number()
-            context["next_page_url"] = f"?{params.urlencode()}"
-        else:
-            context["next_page_url"] = None
+        context["next_page_url"] = _next_page_url(self.request, context.get("page_obj"))
 
-        placement_id = self.request.GET.get("plaatsing")
-        colleague_id = self.request.GET.get("collega")
-        assignment_id = self.request.GET.get("opdracht")
-
-        if placement_id:
-            panel_data = _resolve_placement_panel(self.request, placement_id)
-            if panel_data is not None:
-                context["panel_data"] = panel_data
-        elif colleague_id and not assignment_id:
-            try:
-                colleague = Colleague.objects.get(id=colleague_id)
-                context["panel_data"] = _build_colleague_panel_data(colleague, self.request)
-            except Colleague.DoesNotExist:
-                pass
-        elif assignment_id:
-            try:
-                assignment = Assignment.objects.get(id=assignment_id)
-                context["panel_data"] = _build_assignment_panel_data(assignment, self.request)
-            except Assignment.DoesNotExist:
-                pass
+        _add_panel_data(self.request, context)
         return context
 
 
-class AssignmentListView(ListView):
+class AssignmentListView(InfiniteScrollPaginationMixin, ListView):
     """View for vacancy assignments displayed as cards with infinite scroll pagination"""
 
     model = Assignment
@@ -985,23 +1129,21 @@ class AssignmentListView(ListView):
     paginate_by = 24
     page_kwarg = "pagina"
 
-    def _get_base_queryset(self):
-        has_unfilled_open_service = Exists(
-            Service.objects.filter(
-                assignment=OuterRef("pk"),
-                status="OPEN",
-                placements__isnull=True,
-            )
-        )
+    @cached_property
+    def base_queryset(self):
+        """Open assignments with search applied, built once per request."""
+        has_unfilled_open_service = Exists(open_unfilled_services(assignment=OuterRef("pk")))
         qs = Assignment.objects.filter(has_unfilled_open_service).order_by(F("created_at").desc(nulls_last=True))
         search_filter = self.request.GET.get("zoek")
         if search_filter:
+            client_match = AssignmentOrganizationUnit.objects.filter(
+                Q(organization__name__icontains=search_filter)
+                | Q(organization__label__icontains=search_filter)
+                | Q(organization__abbreviations__icontains=search_filter),
+                assignment=OuterRef("pk"),
+            )
             qs = qs.filter(
-                Q(name__icontains=search_filter)
-                | Q(extra_info__icontains=search_filter)
-                | Q(organizations__name__icontains=search_filter)
-                | Q(organizations__label__icontains=search_filter)
-                | Q(organizations__abbreviations__icontains=search_filter)
+                Q(name__icontains=search_filter) | Q(extra_info__icontains=search_filter) | Exists(client_match)
             )
         beschikbaar_vanaf = self.request.GET.get("beschikbaar_vanaf")
         if beschikbaar_vanaf:
@@ -1016,11 +1158,8 @@ class AssignmentListView(ListView):
         if exclude_filter != "rol":
             rol_filter = [x for x in self.request.GET.getlist("rol") if x.isdigit()]
             if rol_filter:
-                qs = qs.filter(
-                    services__skill__id__in=rol_filter,
-                    services__status="OPEN",
-                    services__placements__isnull=True,
-                )
+                # Semi-joins keep one row per assignment, so no DISTINCT is needed
+                qs = qs.filter(Exists(open_unfilled_services(assignment=OuterRef("pk"), skill_id__in=rol_filter)))
 
         if exclude_filter != "org":
             org_ids = [int(x) for x in self.request.GET.getlist("org") if x.isdigit()]
@@ -1039,23 +1178,37 @@ class AssignmentListView(ListView):
                     matching_ids |= get_org_descendant_ids(type_root_ids)
                 if org_self_ids:
                     matching_ids |= set(org_self_ids)
-                qs = qs.filter(organizations__id__in=matching_ids)
+                qs = qs.filter(
+                    Exists(
+                        AssignmentOrganizationUnit.objects.filter(
+                            assignment=OuterRef("pk"),
+                            organization_id__in=matching_ids,
+                        )
+                    )
+                )
 
         return qs
 
     def get_queryset(self):
-        qs = self._get_base_queryset()
+        qs = self.base_queryset
         qs = self._apply_filters(qs)
-        return qs.distinct().prefetch_related(
+        # Cards show name, period and wanted roles only; leave extra_info and
+        # the source metadata in the database.
+        return qs.only("name", "start_date", "end_date").prefetch_related(
             Prefetch(
                 "services",
-                queryset=Service.objects.filter(
-                    skill__isnull=False,
-                    status="OPEN",
-                    placements__isnull=True,
-                ).select_related("skill"),
+                queryset=open_unfilled_services(skill__isnull=False)
+                .select_related("skill")
+                .only("assignment_id", "skill__name"),
                 to_attr="services_with_skills",
-            )
+            ),
+            # The card shows the name of the first organization; fetch them for
+            # the whole page at once instead of one query per card.
+            Prefetch(
+                "organizations",
+                queryset=OrganizationUnit.objects.only("name", "label"),
+                to_attr="organizations_by_name",
+            ),
         )
 
     def get_template_names(self):
@@ -1082,11 +1235,16 @@ class AssignmentListView(ListView):
         context = super().get_context_data(**kwargs)
         context["render_filter_fields_oob"] = "HX-Request" in self.request.headers
 
-        base_url = reverse("assignment-list")
+        assignment_panel_url = _panel_url_builder(self.request, "opdracht")
         for assignment in context["object_list"]:
-            assignment.panel_url = _build_panel_url(self.request, opdracht=assignment.id)
-            first_org = assignment.organizations.select_related("parent__parent__parent__parent").first()
-            assignment.org_breadcrumb = get_org_breadcrumb(first_org, base_url) if first_org else None
+            assignment.panel_url = assignment_panel_url(assignment.id)
+            first_org = next(iter(assignment.organizations_by_name), None)
+            assignment.org_label = (first_org.label or first_org.name) if first_org else None
+
+        if self.get_template_names()[0] in TEMPLATES_WITHOUT_FILTERS:
+            context["next_page_url"] = _next_page_url(self.request, context.get("page_obj"))
+            _add_panel_data(self.request, context)
+            return context
 
         context["filter_target_url"] = reverse("assignment-list")
         context["search_field"] = "zoek"
@@ -1110,25 +1268,24 @@ class AssignmentListView(ListView):
             active_filters["rol"] = rol_filter
 
         # Skill/role counts: exclude role filter for cross-filtering
-        base_qs = self._get_base_queryset()
-        skill_filtered_qs = self._apply_filters(base_qs, exclude_filter="rol").distinct()
-        skill_ids = skill_filtered_qs.values_list("services__skill__id", flat=True)
-        skill_counts = Counter(sid for sid in skill_ids if sid is not None)
+        base_qs = self.base_queryset
+        skill_filtered_qs = self._apply_filters(base_qs, exclude_filter="rol")
+        skill_counts = _count_per(skill_filtered_qs, "services__skill__id")
 
         # Org counts: exclude the org filter (like rol) so the numbers reflect
         # the other active filters. base_qs is already limited to assignments
         # with an unfilled open service, matching the open_assignments mode.
-        org_filtered_qs = self._apply_filters(base_qs, exclude_filter="org").distinct()
-        org_id_values = org_filtered_qs.values_list("organizations__id", flat=True)
-        org_counts = Counter(oid for oid in org_id_values if oid is not None)
+        org_filtered_qs = self._apply_filters(base_qs, exclude_filter="org")
+        org_counts = _count_per(org_filtered_qs, "organizations__id")
 
         skill_options = [{"value": "", "label": ""}]
         skill_selected_values = []
-        for skill in Skill.objects.order_by("name"):
-            option = {"value": str(skill.id), "label": skill.name, "count": skill_counts.get(skill.id, 0)}
-            if str(skill.id) in active_filters.get("rol", set()):
+        for skill in get_skill_options():
+            value = str(skill["id"])
+            option = {"value": value, "label": skill["name"], "count": skill_counts.get(skill["id"], 0)}
+            if value in rol_filter:
                 option["selected"] = True
-                skill_selected_values.append(str(skill.id))
+                skill_selected_values.append(value)
             skill_options.append(option)
 
         # Organization filter (multi-select via modal)
@@ -1142,41 +1299,7 @@ class AssignmentListView(ListView):
         if org_type_filter:
             active_filters["org_type"] = org_type_filter
 
-        # Build chip display data for org filters
-        org_chip_data: list[dict] = []
-        if org_filter:
-            org_labels = dict(
-                OrganizationUnit.objects.filter(id__in=[int(x) for x in org_filter]).values_list("id", "label")
-            )
-            org_chip_data.extend(
-                {
-                    "param_name": "org",
-                    "param_value": org_id,
-                    "label": org_labels.get(int(org_id), f"Organisatie {org_id}"),
-                }
-                for org_id in org_filter
-            )
-        if org_self_filter:
-            org_self_labels = dict(
-                OrganizationUnit.objects.filter(id__in=[int(x) for x in org_self_filter]).values_list("id", "label")
-            )
-            for org_id in org_self_filter:
-                base_label = org_self_labels.get(int(org_id), f"Organisatie {org_id}")
-                org_chip_data.append(
-                    {
-                        "param_name": "org_self",
-                        "param_value": org_id,
-                        "label": f"{base_label} (direct)",
-                    }
-                )
-        org_chip_data.extend(
-            {
-                "param_name": "org_type",
-                "param_value": type_label,
-                "label": ORG_TYPE_PLURAL.get(type_label, type_label),
-            }
-            for type_label in org_type_filter
-        )
+        org_chip_data = _build_org_chip_data(org_filter, org_self_filter, org_type_filter)
 
         context["active_filters"] = active_filters
         context["active_filter_count"] = len(active_filters)
@@ -1213,13 +1336,7 @@ class AssignmentListView(ListView):
         _finalize_filter_groups(context["filter_groups"])
         context["filter_modal_group_id"] = self.request.GET.get("filter_modal", "")
 
-        # Build next page URL with all current filters
-        if context.get("page_obj") and context["page_obj"].has_next():
-            params = self.request.GET.copy()
-            params["pagina"] = context["page_obj"].next_page_number()
-            context["next_page_url"] = f"?{params.urlencode()}"
-        else:
-            context["next_page_url"] = None
+        context["next_page_url"] = _next_page_url(self.request, context.get("page_obj"))
 
         # Primary button for assignment creation (BDM permission)
         if self.request.user.has_perm("core.add_assignment"):
@@ -1228,32 +1345,11 @@ class AssignmentListView(ListView):
                 "href": reverse("assignment-create"),
             }
 
-        # Side panel
-        placement_id = self.request.GET.get("plaatsing")
-        colleague_id = self.request.GET.get("collega")
-        assignment_id = self.request.GET.get("opdracht")
-
-        if placement_id:
-            panel_data = _resolve_placement_panel(self.request, placement_id)
-            if panel_data is not None:
-                context["panel_data"] = panel_data
-        elif colleague_id and not assignment_id:
-            try:
-                colleague = Colleague.objects.get(id=colleague_id)
-                context["panel_data"] = _build_colleague_panel_data(colleague, self.request)
-            except Colleague.DoesNotExist:
-                pass
-        elif assignment_id:
-            try:
-                assignment = Assignment.objects.select_related("owner").get(id=assignment_id)
-                context["panel_data"] = _build_assignment_panel_data(assignment, self.request)
-            except Assignment.DoesNotExist:
-                pass
-
+        _add_panel_data(self.request, context)
         return context
 
 
-class UserListView(PermissionRequiredMixin, ListView):
+class UserListView(PermissionRequiredMixin, InfiniteScrollPaginationMixin, ListView):
     """View for user list with filtering and infinite scroll pagination"""
 
     model = User
@@ -1262,29 +1358,32 @@ class UserListView(PermissionRequiredMixin, ListView):
     page_kwarg = "pagina"
     permission_required = "rijksauth.view_user"
 
-    def _get_base_queryset(self):
-        """Base queryset with search applied."""
+    @cached_property
+    def base_queryset(self):
+        """Base queryset with search applied, built once per request."""
+        # The rows show name, initial and roles only: skip the password hash and
+        # other auth columns, and don't prefetch labels nobody renders.
         qs = (
-            User.objects.prefetch_related("groups", "colleague__labels__category")
+            User.objects.only("first_name", "last_name", "email")
+            .prefetch_related("groups")
             .filter(is_superuser=False)
             .order_by("last_name", "first_name")
         )
 
         search_filter = self.request.GET.get("zoek")
         if search_filter:
-            qs = qs.annotate(
+            # Every first or last name match is also a full name match. With just
+            # these two terms, both sides of the OR can use the trigram indexes
+            # on User.
+            qs = qs.alias(
                 full_name=Concat("first_name", Value(" "), "last_name"),
-            ).filter(
-                Q(full_name__icontains=search_filter)
-                | Q(first_name__icontains=search_filter)
-                | Q(last_name__icontains=search_filter)
-                | Q(email__icontains=search_filter)
-            )
+            ).filter(Q(full_name__icontains=search_filter) | Q(email__icontains=search_filter))
 
         return qs
 
-    def _get_labels_by_category(self):
-        """Parse selected label IDs grouped by category."""
+    @cached_property
+    def labels_by_category(self):
+        """Selected label IDs grouped by category, looked up once per request."""
         label_ids = [int(lid) for lid in self.request.GET.getlist("labels") if lid.isdigit()]
         if not label_ids:
             return {}
@@ -1298,28 +1397,35 @@ class UserListView(PermissionRequiredMixin, ListView):
 
         exclude_filter can be: "rol", or a category_id (int) for labels.
         """
-        # Label filter: OR within category, AND between categories
-        labels_by_category = self._get_labels_by_category()
+        # Label filter: OR within category, AND between categories. Semi-joins
+        # (EXISTS) rather than joins, so a user matches at most once and the
+        # queryset needs no DISTINCT.
+        labels_by_category = self.labels_by_category
         for cat_id, cat_label_ids in labels_by_category.items():
             if exclude_filter != cat_id:
-                qs = qs.filter(colleague__labels__id__in=cat_label_ids)
+                qs = qs.filter(
+                    Exists(
+                        Colleague.labels.through.objects.filter(
+                            colleague__user=OuterRef("pk"), label_id__in=cat_label_ids
+                        )
+                    )
+                )
 
         # Role filter
         if exclude_filter != "rol":
             role_filter = self.request.GET.get("rol")
             if role_filter and role_filter.isdigit():
-                qs = qs.filter(groups__id=role_filter)
+                qs = qs.filter(Exists(User.groups.through.objects.filter(user_id=OuterRef("pk"), group_id=role_filter)))
 
         return qs
 
     def get_queryset(self):
         """Apply filters to users queryset - exclude superusers"""
-        qs = self._get_base_queryset()
+        qs = self.base_queryset
         label_ids = [int(lid) for lid in self.request.GET.getlist("labels") if lid.isdigit()]
-        if label_ids and not self._get_labels_by_category():
+        if label_ids and not self.labels_by_category:
             return User.objects.none()
-        qs = self._apply_filters(qs)
-        return qs.distinct()
+        return self._apply_filters(qs)
 
     def get_template_names(self):
         """Return appropriate template based on request type"""
@@ -1334,6 +1440,9 @@ class UserListView(PermissionRequiredMixin, ListView):
     def get_context_data(self, **kwargs):
         """Add dynamic filter options"""
         context = super().get_context_data(**kwargs)
+        if self.get_template_names()[0] in TEMPLATES_WITHOUT_FILTERS:
+            context["next_page_url"] = _next_page_url(self.request, context.get("page_obj"))
+            return context
 
         context["search_field"] = "zoek"
         context["search_placeholder"] = "Zoek op naam of email..."
@@ -1354,34 +1463,35 @@ class UserListView(PermissionRequiredMixin, ListView):
             active_filters["rol"] = role_filter
 
         # For each label category, count on queryset excluding that category's filter
-        base_qs = self._get_base_queryset()
+        base_qs = self.base_queryset
 
+        label_options = get_label_options()
         label_filter_groups = []
-        for category in LabelCategory.objects.all():
-            cat_filtered_qs = self._apply_filters(base_qs, exclude_filter=category.id).distinct()
+        for category in get_label_category_options():
+            cat_filtered_qs = self._apply_filters(base_qs, exclude_filter=category["id"])
             cat_user_qs = User.objects.filter(id__in=cat_filtered_qs.values_list("id", flat=True))
-            cat_label_ids = cat_user_qs.values_list("colleague__labels__id", flat=True)
-            cat_label_counts = Counter(lid for lid in cat_label_ids if lid is not None)
+            cat_label_counts = _count_per(cat_user_qs, "colleague__labels__id")
 
             options = [{"value": "", "label": ""}]
             selected_values = []
-            for label in Label.objects.filter(category=category):
+            for label in label_options.get(category["id"], ()):
+                value = str(label["id"])
                 options.append(
                     {
-                        "value": str(label.id),
-                        "label": f"{label.name}",
-                        "count": cat_label_counts.get(label.id, 0),
+                        "value": value,
+                        "label": label["name"],
+                        "count": cat_label_counts.get(label["id"], 0),
                     }
                 )
-                if str(label.id) in active_filters.get("labels", set()):
+                if value in label_filter:
                     options[-1]["selected"] = True
-                    selected_values.append(str(label.id))
+                    selected_values.append(value)
 
             label_filter_groups.append(
                 {
                     "type": "select-multi",
                     "name": "labels",
-                    "label": category.name,
+                    "label": category["name"],
                     "options": options,
                     "selected_values": selected_values,
                 }
@@ -1391,11 +1501,12 @@ class UserListView(PermissionRequiredMixin, ListView):
             {"value": "", "label": "Alle rollen"},
         ]
         role_value = ""
-        for group in Group.objects.all().order_by("name"):
-            role_options.append({"value": str(group.id), "label": group.name})
-            if active_filters.get("rol") == str(group.id):
+        for group in get_group_options():
+            value = str(group["id"])
+            role_options.append({"value": value, "label": group["name"]})
+            if active_filters.get("rol") == value:
                 role_options[-1]["selected"] = True
-                role_value = str(group.id)
+                role_value = value
 
         context["active_filters"] = active_filters
         context["active_filter_count"] = len(active_filters)
@@ -1420,13 +1531,7 @@ class UserListView(PermissionRequiredMixin, ListView):
             },
         }
 
-        # Build next page URL with all current filters
-        if context.get("page_obj") and context["page_obj"].has_next():
-            params = self.request.GET.copy()
-            params["pagina"] = context["page_obj"].next_page_number()
-            context["next_page_url"] = f"?{params.urlencode()}"
-        else:
-            context["next_page_url"] = None
+        context["next_page_url"] = _next_page_url(self.request, context.get("page_obj"))
 
         return context
 
@@ -1573,16 +1678,13 @@ def user_delete(request, pk):
             },
         )
     if request.method == "POST":
-        if hasattr(user, "colleague") and user.colleague:
-            label_names = [label.name for label in user.colleague.labels.all()]
-        else:
-            label_names = []
+        # The audit entry only keeps the names; no need to load the colleague
         context = {
             "email": user.email,
             "first_name": user.first_name,
             "last_name": user.last_name,
-            "label_names": label_names,
-            "group_names": [g.name for g in user.groups.all()],
+            "label_names": list(Label.objects.filter(colleagues__user=user).values_list("name", flat=True)),
+            "group_names": list(user.groups.values_list("name", flat=True)),
         }
         user.delete()
         create_event(
@@ -1963,14 +2065,13 @@ def label_edit(request, pk):
     Returns a partial html page, to be used with htmx
     """
     label = get_object_or_404(Label, pk=pk)
-    category = label.category
     form_post_url = reverse("label-edit", kwargs={"pk": pk})
     modal_title = f"Bewerk label: {label.name}"
     form_button_label = "Opslaan"
     element_id = "labelFormModal"
 
     if request.method == "GET":
-        form = LabelForm(instance=label, category_id=category.id)
+        form = LabelForm(instance=label, category_id=label.category_id)
         return render(
             request,
             "parts/generic_form_modal.html",
@@ -1989,7 +2090,7 @@ def label_edit(request, pk):
         if form.is_valid():
             form.save()
 
-            category_qs = LabelCategory.objects.filter(id=category.id)
+            category_qs = LabelCategory.objects.filter(id=label.category_id)
             category = annotate_usage_counts(category_qs).get()
 
             response = render(request, "parts/label_category.html", {"category": category})
@@ -2019,11 +2120,9 @@ def label_delete(request, pk):
     """
 
     label = get_object_or_404(Label, pk=pk)
-    category = label.category
-
-    label_use_count = label.colleagues.count()
 
     if request.method == "GET":
+        label_use_count = label.colleagues.count()
         return render(
             request,
             "parts/generic_form_modal.html",
@@ -2031,7 +2130,7 @@ def label_delete(request, pk):
                 "modal_title": f"Verwijder label: {label.name}",
                 "warning_modal": True,
                 "modal_element_id": "labelFormModal",
-                "target_element_id": f"label_category_{category.id}",
+                "target_element_id": f"label_category_{label.category_id}",
                 "delete_warning": (
                     f"Weet je zeker dat je dit label wilt verwijderen? Het wordt gebruikt op {label_use_count} plekken."
                 ),
@@ -2040,9 +2139,10 @@ def label_delete(request, pk):
             },
         )
     if request.method == "POST":
+        category_id = label.category_id
         label.delete()
 
-        category_qs = LabelCategory.objects.filter(id=category.id)
+        category_qs = LabelCategory.objects.filter(id=category_id)
         category = annotate_usage_counts(category_qs).get()
 
         response = render(
@@ -2212,12 +2312,24 @@ def _assignment_audit_snapshot(assignment) -> dict:
     (``"Java (Robbert)"``) or ``"open"`` when unfilled, plus the opdrachtgevers
     and the name. One entry per rol, so placements aren't duplicated. Empty
     lists are left out of the audit."""
-    services = []
-    for s in assignment.services.select_related("skill").prefetch_related("placements__colleague"):
-        rol = s.skill.name if s.skill_id else s.description
-        names = [p.colleague.name for p in s.placements.all()]
-        services.append(f"{rol} ({', '.join(names) if names else 'open'})")
-    organizations = [rel.organization.label or rel.organization.name for rel in assignment.organization_relations.all()]
+    # One flat LEFT JOIN row per (service, placement) instead of hydrating
+    # services, placements and colleagues as model instances.
+    rows = (
+        Service.objects.filter(assignment=assignment)
+        .order_by("id", "placements__id")
+        .values_list("id", "skill__name", "description", "placements__colleague__name")
+    )
+    names_by_service: dict[int, tuple[str, list[str]]] = {}
+    for service_id, skill_name, description, colleague_name in rows:
+        rol = skill_name if skill_name is not None else description
+        _, names = names_by_service.setdefault(service_id, (rol, []))
+        if colleague_name is not None:
+            names.append(colleague_name)
+    services = [f"{rol} ({', '.join(names) if names else 'open'})" for rol, names in names_by_service.values()]
+    organizations = [
+        label or name
+        for label, name in assignment.organization_relations.values_list("organization__label", "organization__name")
+    ]
     snapshot = {"name": assignment.name}
     if services:
         snapshot["services"] = services
@@ -2241,13 +2353,13 @@ def user_profile(request):
         panel_data = _resolve_placement_panel(request, placement_id)
     elif assignment_id:
         try:
-            assignment = Assignment.objects.get(id=assignment_id)
+            assignment = Assignment.objects.select_related("owner").get(id=assignment_id)
             panel_data = _build_assignment_panel_data(assignment, request)
         except Assignment.DoesNotExist:
             pass
     elif colleague_id:
         try:
-            panel_colleague = Colleague.objects.get(id=colleague_id)
+            panel_colleague = Colleague.objects.prefetch_related("labels__category").get(id=colleague_id)
             panel_data = _build_colleague_panel_data(panel_colleague, request)
         except Colleague.DoesNotExist:
             pass
@@ -2260,11 +2372,8 @@ def user_profile(request):
         if hx_target == "side_panel-content" and panel_data:
             return render(request, panel_data["panel_content_template"], {"panel_data": panel_data})
 
-    # Build label data per category for the data list rows
-    label_categories = []
-    for category in LabelCategory.objects.order_by("name"):
-        selected = list(colleague.labels.filter(category=category).order_by("name")) if colleague else []
-        label_categories.append({"category": category, "labels": selected})
+    # One data list row per label category; each row's inline-edit widget loads its own labels
+    label_categories = get_label_category_options()
 
     assignment_list = _get_colleague_assignments(request, colleague, viewer=colleague) if colleague else []
 
@@ -2392,13 +2501,13 @@ def assignment_create(request):
     """Handle assignment creation - standalone form page."""
     template = "assignment_create.html"
 
-    skill_choices = [("", " "), ("__new__", "+ Nieuwe rol aanmaken")]
-    skill_choices.extend((str(s.id), s.name) for s in Skill.objects.order_by("name"))
+    skill_choices = get_service_skill_choices()
 
     if request.method == "GET":
         initial = {}
-        if hasattr(request.user, "colleague"):
-            initial["owner"] = request.user.colleague
+        colleague = getattr(request.user, "colleague", None)
+        if colleague is not None:
+            initial["owner"] = colleague
         form = AssignmentCreateForm(initial=initial)
         service_formset = ServiceFormSet(prefix="service", form_kwargs={"skill_choices": skill_choices})
         return render(request, template, {"form": form, "service_formset": service_formset})
@@ -2472,25 +2581,17 @@ def _get_org_counts(count_mode: str, excluded_org_ids: list[int], viewer) -> Cou
     if count_mode == "none":
         return Counter()
     if count_mode == "open_assignments":
-        has_unfilled_open_service = Exists(
-            Service.objects.filter(
-                assignment=OuterRef("pk"),
-                status="OPEN",
-                placements__isnull=True,
-            )
-        )
+        has_unfilled_open_service = Exists(open_unfilled_services(assignment=OuterRef("pk")))
         assignment_qs = Assignment.objects.filter(has_unfilled_open_service)
         if excluded_org_ids:
             assignment_qs = assignment_qs.exclude(organizations__id__in=excluded_org_ids)
-        org_id_list = assignment_qs.values_list("organizations__id", flat=True)
-    else:
-        visible_placements = filter_visible_placements(
-            annotate_placement_dates(Placement.objects.all()), timezone.now().date(), viewer
-        )
-        if excluded_org_ids:
-            visible_placements = visible_placements.exclude(service__assignment__organizations__id__in=excluded_org_ids)
-        org_id_list = visible_placements.values_list("service__assignment__organizations__id", flat=True)
-    return Counter(org_id for org_id in org_id_list if org_id is not None)
+        return _count_per(assignment_qs, "organizations__id")
+    visible_placements = filter_visible_placements(
+        annotate_placement_dates(Placement.objects.all()), timezone.now().date(), viewer
+    )
+    if excluded_org_ids:
+        visible_placements = visible_placements.exclude(service__assignment__organizations__id__in=excluded_org_ids)
+    return _count_per(visible_placements, "service__assignment__organizations__id")
 
 
 def _get_top_org_options(
@@ -2542,9 +2643,10 @@ def _get_top_org_options(
     org_wanted = selected_ids | set(top_unselected)
 
     options: list[dict] = []
+    label_ids = org_wanted | self_ids
+    labels = dict(OrganizationUnit.objects.filter(id__in=label_ids).values_list("id", "label")) if label_ids else {}
 
     if org_wanted:
-        labels = dict(OrganizationUnit.objects.filter(id__in=org_wanted).values_list("id", "label"))
         options.extend(
             {
                 "param": "org",
@@ -2557,12 +2659,11 @@ def _get_top_org_options(
         )
 
     if self_ids:
-        self_labels = dict(OrganizationUnit.objects.filter(id__in=self_ids).values_list("id", "label"))
         options.extend(
             {
                 "param": "org_self",
                 "value": str(org_id),
-                "label": f"{self_labels.get(org_id) or f'Organisatie {org_id}'} (direct)",
+                "label": f"{labels.get(org_id) or f'Organisatie {org_id}'} (direct)",
                 "count": org_counts.get(org_id, 0),
                 "selected": True,
             }
@@ -2625,15 +2726,9 @@ def _finalize_filter_groups(filter_groups: list[dict], *, top_n: int = 3) -> Non
         group["has_more"] = len(real_options) > len(top)
 
 
-def _build_org_hierarchy(
-    org_self_counts: Counter[int], excluded_org_ids: list[int], *, prune_empty: bool
-) -> list[dict]:
+def _build_org_hierarchy(org_self_counts: Counter[int], *, prune_empty: bool) -> list[dict]:
     """Build the grouped org tree hierarchy for the client modal."""
-    all_orgs = list(
-        OrganizationUnit.objects.exclude(id__in=excluded_org_ids).values(
-            "id", "parent_id", "name", "label", "abbreviations"
-        )
-    )
+    all_orgs, root_types = get_org_tree_units()
 
     units_by_id: dict[int, dict] = {}
     for org in all_orgs:
@@ -2700,16 +2795,6 @@ def _build_org_hierarchy(
         return result
 
     # Group roots by OrganizationUnit type
-    root_ids = {u["id"] for u in roots}
-    type_links = (
-        OrganizationUnit.organization_types.through.objects.filter(organizationunit_id__in=root_ids)
-        .select_related("organizationtype")
-        .values_list("organizationunit_id", "organizationtype__label")
-    )
-    root_types: dict[int, list[str]] = {}
-    for unit_id, type_label in type_links:
-        root_types.setdefault(unit_id, []).append(type_label)
-
     grouped: dict[str, list[dict]] = {}
     ungrouped: list[dict] = []
     for unit in roots:
@@ -2763,7 +2848,7 @@ def client_modal(request):
 
     viewer = getattr(request.user, "colleague", None)
     org_self_counts = _get_org_counts(count_mode, excluded_org_ids, viewer)
-    hierarchy = _build_org_hierarchy(org_self_counts, excluded_org_ids, prune_empty=count_mode != "none")
+    hierarchy = _build_org_hierarchy(org_self_counts, prune_empty=count_mode != "none")
     current_selections = _build_current_selections(request)
 
     template = "parts/assignment_org_modal.html" if count_mode == "none" else "parts/client_modal.html"
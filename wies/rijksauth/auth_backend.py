@@ -58,7 +58,9 @@ class AuthBackend(ModelBackend):
         return None
 
     def get_user(self, user_id):
+        # Nearly every view reads request.user.colleague; join it in here so the
+        # reverse one-to-one doesn't cost a second query on each request.
         try:
-            return User.objects.get(pk=user_id)
+            return User.objects.select_related("colleague").get(pk=user_id)
         except User.DoesNotExist:
             return None
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.7 on 2026-10-17 02:38
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import migrations, models
+from django.db.models.functions import Concat, Upper
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("rijksauth", "0006_user_oidc_sub"),
+        # creates the pg_trgm extension
+        ("core", "0010_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=GinIndex(
+                OpClass(Upper(Concat("first_name", models.Value(" "), "last_name")), name="gin_trgm_ops"),
+                name="user_full_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=GinIndex(OpClass(Upper("email"), name="gin_trgm_ops"), name="user_email_trgm"),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.contrib.auth.models import AbstractUser, BaseUserManager
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
-from django.db.models.functions import Lower
+from django.db.models.functions import Concat, Lower, Upper
 
 
 class UserManager(BaseUserManager):
@@ -39,6 +40,14 @@ class User(AbstractUser):
         constraints = [
             models.UniqueConstraint(Lower("email"), name="unique_user_email_ci"),
         ]
+        indexes = [
+            # Trigram indexes for the user list's icontains search on full name and email
+            GinIndex(
+                OpClass(Upper(Concat("first_name", models.Value(" "), "last_name")), name="gin_trgm_ops"),
+                name="user_full_name_trgm",
+            ),
+            GinIndex(OpClass(Upper("email"), name="gin_trgm_ops"), name="user_email_trgm"),
+        ]
 
 
 class AuthEvent(models.Model):
@@ -1,7 +1,8 @@
 import zoneinfo
 from datetime import date, datetime, timedelta
 
-from django.db.models import Count
+from django.core.cache import cache
+from django.db.models import Count, Q
 from django.db.models.functions import TruncDate
 from django.utils import timezone
 
@@ -13,6 +14,19 @@ MAU_DAYS = 30
 WAU_DAYS = 7
 FAILURES_DAYS = 30
 
+USAGE_STATS_KEY = "usage:stats"
+USAGE_STATS_TTL = 60  # seconds; per-process cache, see FILTER_OPTIONS_TTL in wies.core.services.filter_options
+
+
+def get_cached_usage_stats() -> dict:
+    """``get_usage_stats`` for the staff dashboard, cached briefly.
+
+    The numbers scan the whole login event table and only need to be roughly
+    current, so every login is not worth an invalidation; they refresh after
+    the TTL.
+    """
+    return cache.get_or_set(USAGE_STATS_KEY, get_usage_stats, USAGE_STATS_TTL)
+
 
 def get_usage_stats(now: datetime | None = None) -> dict:
     if now is None:
@@ -22,14 +36,16 @@ def get_usage_stats(now: datetime | None = None) -> dict:
 
     mau_cutoff = now - timedelta(days=MAU_DAYS)
     wau_cutoff = now - timedelta(days=WAU_DAYS)
-
-    mau = success.filter(timestamp__gte=mau_cutoff).values("user_email").distinct().count()
-    wau = success.filter(timestamp__gte=wau_cutoff).values("user_email").distinct().count()
-
-    total_ever = success.values("user_email").distinct().count()
-
     failures_cutoff = now - timedelta(days=FAILURES_DAYS)
-    failures_30d = AuthEvent.objects.filter(name="Login.fail", timestamp__gte=failures_cutoff).count()
+
+    # All headline numbers in one pass over the table
+    is_success = Q(name="Login.success")
+    totals = AuthEvent.objects.filter(name__in=["Login.success", "Login.fail"]).aggregate(
+        mau=Count("user_email", distinct=True, filter=is_success & Q(timestamp__gte=mau_cutoff)),
+        wau=Count("user_email", distinct=True, filter=is_success & Q(timestamp__gte=wau_cutoff)),
+        total_ever=Count("user_email", distinct=True, filter=is_success),
+        failures_30d=Count("id", filter=Q(name="Login.fail", timestamp__gte=failures_cutoff)),
+    )
 
     today_local: date = now.astimezone(DASHBOARD_TZ).date()
     daily_start_local = today_local - timedelta(days=DAILY_WINDOW_DAYS - 1)
@@ -51,11 +67,8 @@ def get_usage_stats(now: datetime | None = None) -> dict:
     total_logins_90d = sum(c for _, c in daily_logins)
 
     return {
-        "mau": mau,
-        "wau": wau,
-        "total_ever": total_ever,
+        **totals,
         "total_logins_90d": total_logins_90d,
-        "failures_30d": failures_30d,
         "daily_logins": daily_logins,
         "max_daily": max_daily,
     }
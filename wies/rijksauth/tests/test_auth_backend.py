@@ -2,6 +2,7 @@ import pytest
 from django.contrib.auth import authenticate, get_user_model
 from django.test import TestCase
 
+from wies.core.models import Colleague
 from wies.rijksauth.auth_backend import AuthBackend
 from wies.rijksauth.models import AuthEvent
 
@@ -126,6 +127,14 @@ class AuthBackendTest(TestCase):
         assert user.pk == self.test_user.pk
         assert user.email == "test@rijksoverheid.nl"
 
+    def test_get_user_loads_colleague_in_same_query(self):
+        """request.user.colleague is read on most pages; it must not cost another query"""
+        Colleague.objects.create(user=self.test_user, name="Test User", email=self.test_user.email, source="wies")
+        backend = AuthBackend()
+        with self.assertNumQueries(1):
+            user = backend.get_user(self.test_user.pk)
+            assert user.colleague.name == "Test User"
+
     def test_get_user_non_existent(self):
         """Test that get_user returns None for non-existent ID"""
         backend = AuthBackend()
@@ -5,7 +5,7 @@ from django.contrib.auth import get_user_model
 from django.test import TestCase
 
 from wies.rijksauth.models import AuthEvent
-from wies.rijksauth.services.usage import DAILY_WINDOW_DAYS, get_usage_stats
+from wies.rijksauth.services.usage import DAILY_WINDOW_DAYS, get_cached_usage_stats, get_usage_stats
 
 User = get_user_model()
 AMS = zoneinfo.ZoneInfo("Europe/Amsterdam")
@@ -35,6 +35,15 @@ class GetUsageStatsTest(TestCase):
         assert len(stats["daily_logins"]) == DAILY_WINDOW_DAYS
         assert all(count == 0 for _, count in stats["daily_logins"])
 
+    def test_headline_numbers_and_daily_counts_in_two_queries(self):
+        make_event("Login.success", "a@rijksoverheid.nl", self.now - timedelta(days=1))
+        make_event("Login.fail", "b@rijksoverheid.nl", self.now - timedelta(days=2))
+
+        with self.assertNumQueries(2):
+            stats = get_usage_stats(now=self.now)
+
+        assert (stats["mau"], stats["wau"], stats["total_ever"], stats["failures_30d"]) == (1, 1, 1, 1)
+
     def test_distinct_users_for_mau_and_wau(self):
         User.objects.create_user(email="a@rijksoverheid.nl")
         User.objects.create_user(email="b@rijksoverheid.nl")
@@ -111,3 +120,11 @@ class GetUsageStatsTest(TestCase):
         non_zero_days = [(d, c) for d, c in stats["daily_logins"] if c > 0]
 
         assert non_zero_days == [(local_late_evening.date(), 1)]
+
+
+class GetCachedUsageStatsTest(TestCase):
+    def test_second_call_is_served_from_cache(self):
+        first = get_cached_usage_stats()
+
+        with self.assertNumQueries(0):
+            assert get_cached_usage_stats() == first